@@ -1,9 +1,11 @@
 """BRouter API integration for offline routing."""
 
 import json
+import threading
 
 import gpxpy
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import get_config
 from .exceptions import RoutingError
@@ -11,6 +13,26 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# BRouter requests are issued from several worker threads and requests.Session is not
+# thread-safe, so every thread keeps its own session with its own keep-alive connection.
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Returns the BRouter session of the calling thread, creating it on first use.
+
+    Returns:
+        A session that is only ever used by the current thread.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        # A thread sends one request at a time, so a single pooled connection suffices
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        _thread_local.session = session
+    return session
+
 
 def check_brouter_availability() -> bool:
     """Checks if the BRouter server is reachable and responding.
@@ -23,7 +45,7 @@ def check_brouter_availability() -> bool:
     url = f"{base_url}/brouter"
     try:
         logger.debug(f"Checking BRouter availability at {url}")
-        r = requests.get(url, timeout=5)
+        r = _get_session().get(url, timeout=5)
         # BRouter might return 400 (Bad Request) if called without parameters,
         # which is still a sign that the server is up and responding.
         return r.status_code < 500
@@ -56,7 +78,7 @@ def route_to_address(lat_from: float, lon_from: float, lat_to: float, lon_to: fl
     url = f"{base_url}/brouter"
     lonlats = f"{lon_from:.15g},{lat_from:.15g}|{lon_to:.15g},{lat_to:.15g}"
     try:
-        r = requests.get(url, params={"lonlats": lonlats, "profile": "trekking", "format": format}, timeout=30)
+        r = _get_session().get(url, params={"lonlats": lonlats, "profile": "trekking", "format": format}, timeout=30)
         r.raise_for_status()
         return r.text
     except Exception as e:
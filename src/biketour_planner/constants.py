@@ -1,10 +1,19 @@
 """Centralized constants for the Bike Tour Planner."""
 
+# Geodesy
+EARTH_RADIUS_M = 6371000.0
+
 # Routing defaults
 DEFAULT_MAX_CONNECTION_DISTANCE_M = 1000.0
 DEFAULT_START_SEARCH_RADIUS_KM = 3.0
 DEFAULT_TARGET_SEARCH_RADIUS_KM = 10.0
 DEFAULT_MAX_CHAIN_LENGTH = 20
+BROUTER_MAX_PARALLEL_REQUESTS = 8
+
+# GPX index cache
+GPX_INDEX_CACHE_DIR = ".cache"
+GPX_INDEX_CACHE_VERSION = 6
+GPX_INDEX_PARALLEL_MIN_FILES = 8
 
 # Elevation calculation
 ELEVATION_SMOOTHING_WINDOW = 5
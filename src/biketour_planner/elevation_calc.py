@@ -50,6 +50,93 @@ def calculate_elevation_gain_simple(elevations: list[float], threshold: float =
     return total_gain
 
 
+def _gain_loss_simple(values: np.ndarray, threshold: float) -> tuple[float, float]:
+    """Berechnet Anstiege und Abstiege mit Schwellwert in einem Durchlauf.
+
+    Entspricht `calculate_elevation_gain_simple` für beide Richtungen, setzt
+    aber voraus, dass keine fehlenden Werte mehr enthalten sind.
+
+    Args:
+        values: Höhenwerte in Metern ohne fehlende Werte.
+        threshold: Minimaler Höhenunterschied in Metern der gezählt wird.
+
+    Returns:
+        Tuple aus (Anstiege, Abstiege) in Metern.
+    """
+    gain = 0.0
+    loss = 0.0
+    acc_up = 0.0
+    acc_down = 0.0
+
+    for diff in np.diff(values).tolist():
+        if diff > 0:
+            acc_up += diff
+            if acc_up >= threshold:
+                gain += acc_up
+                acc_up = 0.0
+            acc_down = 0.0
+        elif diff < 0:
+            acc_down -= diff
+            if acc_down >= threshold:
+                loss += acc_down
+                acc_down = 0.0
+            acc_up = 0.0
+        else:
+            acc_up = 0.0
+            acc_down = 0.0
+
+    return gain, loss
+
+
+def _valid_elevations(elevations: list[float] | np.ndarray) -> np.ndarray:
+    """Wandelt Höhenwerte in ein Float-Array ohne fehlende Werte um.
+
+    Args:
+        elevations: Liste oder Array der Höhenwerte (None oder NaN für fehlende Werte).
+
+    Returns:
+        Float-Array mit allen gültigen Höhenwerten.
+    """
+    values = np.asarray(elevations, dtype=np.float64)
+    return values[~np.isnan(values)]
+
+
+def calculate_elevation_gain_loss_smoothed(
+    elevations: list[float] | np.ndarray, window_size: int = 5, threshold: float = 3.0
+) -> tuple[float, float]:
+    """Berechnet Anstiege und Abstiege mit Glättung in einem Durchlauf.
+
+    Die Glättung wird nur einmal für beide Richtungen berechnet.
+
+    Args:
+        elevations: Liste oder Array der Höhenwerte in Metern.
+        window_size: Fenstergröße für gleitenden Durchschnitt (Default: 5 Punkte).
+        threshold: Minimaler Höhenunterschied in Metern der gezählt wird (Default: 3m).
+
+    Returns:
+        Tuple aus (Anstiege, Abstiege) in Metern.
+
+    Example:
+        >>> gain, loss = calculate_elevation_gain_loss_smoothed([100, 102, 99, 103, 101, 110, 108, 115, 113, 120])
+    """
+    if len(elevations) < 2:
+        return 0.0, 0.0
+
+    return _gain_loss_smoothed(_valid_elevations(elevations), window_size, threshold)
+
+
+def _gain_loss_smoothed(values: np.ndarray, window_size: int, threshold: float) -> tuple[float, float]:
+    """Kern von `calculate_elevation_gain_loss_smoothed` für bereits bereinigte Höhenwerte."""
+    if len(values) < window_size + 1:
+        # Fallback auf einfache Methode bei zu wenig Punkten
+        return _gain_loss_simple(values, threshold)
+
+    # Glättung mit gleitendem Durchschnitt
+    smoothed = np.convolve(values, np.ones(window_size) / window_size, mode="valid")
+
+    return _gain_loss_simple(smoothed, threshold)
+
+
 def calculate_elevation_gain_smoothed(
     elevations: list[float], window_size: int = 5, threshold: float = 3.0, calculate_descent: bool = False
 ) -> float:
@@ -72,21 +159,61 @@ def calculate_elevation_gain_smoothed(
         >>> gain = calculate_elevation_gain_smoothed(elevations)
         >>> print(f"{gain:.0f}m")  # Glattere, realistischere Werte
     """
-    if not elevations or len(elevations) < 2:
-        return 0.0
+    gain, loss = calculate_elevation_gain_loss_smoothed(elevations, window_size, threshold)
+    return loss if calculate_descent else gain
 
-    # Filtere None-Werte
-    valid_elevations = [e for e in elevations if e is not None]
 
-    if len(valid_elevations) < window_size + 1:
-        # Fallback auf einfache Methode bei zu wenig Punkten
-        return calculate_elevation_gain_simple(valid_elevations, threshold, calculate_descent)
+def calculate_elevation_gain_loss_segment_based(
+    elevations: list[float] | np.ndarray, min_segment_length: int = 10
+) -> tuple[float, float]:
+    """Berechnet Anstiege und Abstiege segment-basiert in einem Durchlauf.
 
-    # Glättung mit gleitendem Durchschnitt
-    smoothed = np.convolve(valid_elevations, np.ones(window_size) / window_size, mode="valid")
+    Die Wendepunkte zwischen Anstiegs- und Abstiegssegmenten werden vektorisiert
+    über die Vorzeichenwechsel der geglätteten Höhendifferenzen bestimmt.
+
+    Args:
+        elevations: Liste oder Array der Höhenwerte in Metern.
+        min_segment_length: Minimale Anzahl Punkte für ein gültiges Segment (Default: 10).
+
+    Returns:
+        Tuple aus (Anstiege, Abstiege) in Metern.
+
+    Example:
+        >>> elevations = list(range(100, 200, 5)) + list(range(200, 180, -2))
+        >>> ascent, descent = calculate_elevation_gain_loss_segment_based(elevations)
+    """
+    if len(elevations) < 2:
+        return 0.0, 0.0
+
+    return _gain_loss_segment_based(_valid_elevations(elevations), min_segment_length)
+
+
+def _gain_loss_segment_based(values: np.ndarray, min_segment_length: int) -> tuple[float, float]:
+    """Kern von `calculate_elevation_gain_loss_segment_based` für bereits bereinigte Höhenwerte."""
+    if len(values) < min_segment_length:
+        # Fallback auf einfache Methode (ohne Schwellwert) für sehr kurze Tracks
+        return _gain_loss_simple(values, threshold=0.0)
+
+    # Glättung (kleines Fenster um nur Rauschen zu entfernen)
+    window = 3
+    smoothed = np.convolve(values, np.ones(window) / window, mode="valid")
 
-    # Berechne Anstiege mit Schwellwert über die einfache Methode
-    return calculate_elevation_gain_simple(smoothed.tolist(), threshold, calculate_descent)
+    # Richtung zwischen aufeinanderfolgenden Punkten
+    is_ascending = np.diff(smoothed) > 0
+    if is_ascending.size == 0:
+        return 0.0, 0.0
+
+    # Segmentgrenzen: Start, jeder Richtungswechsel und das Ende
+    turns = np.flatnonzero(is_ascending[1:] != is_ascending[:-1]) + 1
+    bounds = np.concatenate(([0], turns, [len(smoothed) - 1]))
+
+    changes = smoothed[bounds[1:]] - smoothed[bounds[:-1]]
+    ascending = is_ascending[bounds[:-1]]
+
+    ascent = float(changes[ascending & (changes > 0)].sum())
+    descent = float(-changes[~ascending & (changes < 0)].sum())
+
+    return ascent, descent
 
 
 def calculate_elevation_gain_segment_based(
@@ -113,64 +240,34 @@ def calculate_elevation_gain_segment_based(
         >>> descent = calculate_elevation_gain_segment_based(elevations, calculate_descent=True)
         >>> print(f"Anstiege: {ascent:.0f}m, Abstiege: {descent:.0f}m")
     """
-    if not elevations or len(elevations) < 2:
-        return 0.0
+    ascent, descent = calculate_elevation_gain_loss_segment_based(elevations, min_segment_length)
+    return descent if calculate_descent else ascent
 
-    # Filtere None-Werte
-    valid_elevations = [e for e in elevations if e is not None]
 
-    if len(valid_elevations) < min_segment_length:
-        # Fallback auf einfache Methode (ohne Schwellwert) für sehr kurze Tracks
-        return calculate_elevation_gain_simple(valid_elevations, threshold=0.0, calculate_descent=calculate_descent)
+def calculate_elevation_gain_loss(elevations: list[float] | np.ndarray) -> tuple[float, float]:
+    """Berechnet Anstiege und Abstiege als Mittel aus segment-basierter und geglätteter Methode.
 
-    # Glättung (kleines Fenster um nur Rauschen zu entfernen)
-    window = 3
-    smoothed = np.convolve(valid_elevations, np.ones(window) / window, mode="valid")
-
-    # Finde Wendepunkte (Übergang Anstieg <-> Abstieg)
-    is_ascending = []
-    for i in range(1, len(smoothed)):
-        is_ascending.append(smoothed[i] > smoothed[i - 1])
-
-    # Identifiziere Segmente
-    segments = []
-    segment_start = 0
-    current_direction = is_ascending[0] if is_ascending else None
-
-    for i in range(1, len(is_ascending)):
-        if is_ascending[i] != current_direction:
-            # Richtungswechsel -> Segment abschließen
-            segments.append(
-                {
-                    "start": segment_start,
-                    "end": i,
-                    "ascending": current_direction,
-                    "elevation_change": smoothed[i] - smoothed[segment_start],
-                }
-            )
-            segment_start = i
-            current_direction = is_ascending[i]
-
-    # Letztes Segment
-    if segment_start < len(smoothed) - 1:
-        segments.append(
-            {
-                "start": segment_start,
-                "end": len(smoothed) - 1,
-                "ascending": current_direction,
-                "elevation_change": smoothed[-1] - smoothed[segment_start],
-            }
-        )
-
-    # Summiere aufsteigende oder absteigende Segmente
-    if calculate_descent:
-        # Summiere Abstiege (negative elevation_change, als Absolutwert)
-        total = sum(abs(seg["elevation_change"]) for seg in segments if not seg["ascending"] and seg["elevation_change"] < 0)
-    else:
-        # Summiere Anstiege (positive elevation_change)
-        total = sum(seg["elevation_change"] for seg in segments if seg["ascending"] and seg["elevation_change"] > 0)
-
-    return total
+    Beide Methoden sind für sich allein nicht genau genug, daher wird für die
+    Track-Statistiken ihr Mittelwert verwendet. Die Höhenwerte werden dafür nur
+    einmal bereinigt und in ein Array umgewandelt.
+
+    Args:
+        elevations: Liste oder Array der Höhenwerte in Metern.
+
+    Returns:
+        Tuple aus (Anstiege, Abstiege) in Metern.
+
+    Example:
+        >>> ascent, descent = calculate_elevation_gain_loss([100, 102, 99, 103, 101, 110, 108, 115, 113, 120])
+    """
+    if len(elevations) < 2:
+        return 0.0, 0.0
+
+    values = _valid_elevations(elevations)
+    ascent_segment, descent_segment = _gain_loss_segment_based(values, min_segment_length=10)
+    ascent_smoothed, descent_smoothed = _gain_loss_smoothed(values, window_size=5, threshold=3.0)
+
+    return (ascent_segment + ascent_smoothed) / 2, (descent_segment + descent_smoothed) / 2
 
 
 # Beispiel-Vergleich der drei Methoden
@@ -19,7 +19,7 @@ from reportlab.lib.units import cm
 from reportlab.platypus import Image, PageBreak, Paragraph
 from tqdm import tqdm
 
-from .gpx_route_manager_static import haversine, read_gpx_file
+from .gpx_route_manager_static import gpx_point_arrays, haversine_vec, read_gpx_file, read_gpx_points_fast
 from .logger import get_logger
 
 # Initialisiere Logger
@@ -45,39 +45,30 @@ def extract_elevation_profile(gpx_file: Path) -> tuple[np.ndarray, np.ndarray]:
     logger.debug(f"Extrahiere Höhenprofil aus {gpx_file.name}")
     start_time = time.time()
 
-    gpx = read_gpx_file(gpx_file)
+    # Schneller Leser ohne gpxpy-Objektbaum, gpxpy nur als Fallback
+    track = read_gpx_points_fast(gpx_file)
+    if track is None or len(track[0]) == 0:
+        gpx = read_gpx_file(gpx_file)
 
-    if gpx is None or not gpx.tracks:
-        raise ValueError(f"Konnte {gpx_file.name} nicht lesen oder keine Tracks gefunden")
+        if gpx is None or not gpx.tracks:
+            raise ValueError(f"Konnte {gpx_file.name} nicht lesen oder keine Tracks gefunden")
 
-    distances = [0.0]  # Start bei 0 km
-    elevations = []
+        track = gpx_point_arrays(gpx)
 
-    prev_point = None
-    cumulative_distance = 0.0
-
-    for track in gpx.tracks:
-        for segment in track.segments:
-            for point in segment.points:
-                if point.elevation is None:
-                    continue
-
-                elevations.append(point.elevation)
-
-                if prev_point is not None:
-                    dist = haversine(prev_point.latitude, prev_point.longitude, point.latitude, point.longitude)
-                    cumulative_distance += dist / 1000.0  # in km
-                    distances.append(cumulative_distance)
+    lats, lons, elevations = track
+    has_elevation = ~np.isnan(elevations)
+    if not has_elevation.any():
+        raise ValueError(f"Keine Höhendaten in {gpx_file.name} gefunden")
 
-                prev_point = point
+    lats, lons, elevations = lats[has_elevation], lons[has_elevation], elevations[has_elevation]
 
-    if not elevations:
-        raise ValueError(f"Keine Höhendaten in {gpx_file.name} gefunden")
+    # Kumulierte Distanz in km, Start bei 0 km
+    distances = np.concatenate(([0.0], np.cumsum(haversine_vec(lats[:-1], lons[:-1], lats[1:], lons[1:]) / 1000.0)))
 
     elapsed = time.time() - start_time
     logger.debug(f"Höhenprofil extrahiert für {gpx_file.name} in {elapsed:.2f}s ({len(elevations)} Punkte)")
 
-    return np.array(distances), np.array(elevations)
+    return distances, elevations
 
 
 def calculate_gradient(distances: np.ndarray, elevations: np.ndarray) -> np.ndarray:
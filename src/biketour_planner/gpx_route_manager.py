@@ -1,23 +1,51 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import gpxpy
+import numpy as np
 from tqdm import tqdm
 
 from .brouter import get_route2address_with_stats
 from .config import get_config
+from .constants import (
+    BROUTER_MAX_PARALLEL_REQUESTS,
+    GPX_INDEX_CACHE_DIR,
+    GPX_INDEX_CACHE_VERSION,
+    GPX_INDEX_PARALLEL_MIN_FILES,
+)
 from .gpx_route_manager_static import (
+    PointStrip,
+    are_near_bounding_boxes,
+    bounding_box_min_distance,
+    build_point_strip,
+    find_closest_point_in_records,
     find_closest_point_in_track,
+    find_closest_point_per_track,
     get_base_filename,
-    get_statistics4track,
+    get_bounding_box,
+    get_statistics4points,
+    get_track_points,
+    gpx_point_arrays,
     haversine,
+    haversine_rad_term,
+    haversine_term_to_m,
+    make_point_records,
     read_gpx_file,
+    read_gpx_file_cached,
+    read_gpx_points_fast,
+    scan_gpx_files,
+    to_radian_point,
+    write_gpx_track,
 )
 from .logger import get_logger
 from .models import RouteContext, RoutePosition, RouteStatistics
+from .utils.cache import load_pickle_cache, save_pickle_cache
 
 if TYPE_CHECKING:
     pass
@@ -99,6 +127,8 @@ class GPXRouteManager:
         self.target_search_radius_km = config.routing.target_search_radius_km
 
         self.gpx_index: GPXIndex = {}
+        self._bbox_table: tuple[list[str], np.ndarray] | None = None
+        self._point_strip: tuple[list[str], PointStrip] | None = None
         self._preprocess_gpx_directory()
 
     def _preprocess_gpx_directory(self) -> None:
@@ -107,56 +137,186 @@ class GPXRouteManager:
         This preprocessing avoids repeatedly parsing the same GPX files during
         route search and significantly speeds up processing.
 
+        The extracted metadata is cached per file in ``<gpx_dir>/.cache``,
+        together with the size and modification time of each file. Later runs
+        only parse files that were added or modified since.
+
         Note:
             Files that cannot be parsed are silently skipped.
         """
-        gpx_files = list(Path(self.gpx_dir).glob("*.gpx"))
+        cache_file = Path(self.gpx_dir) / GPX_INDEX_CACHE_DIR / f"gpx_index_v{GPX_INDEX_CACHE_VERSION}.pkl"
+        cached_entries = load_pickle_cache(cache_file)
+        if not isinstance(cached_entries, dict):
+            cached_entries = {}
+
+        gpx_files = scan_gpx_files(Path(self.gpx_dir))
+
+        entries: dict[str, dict[str, Any]] = {}
+        stale_files = []
+        for gpx_file, size, mtime_ns in gpx_files:
+            file_stat = (size, mtime_ns)
+            entry = cached_entries.get(gpx_file.name)
+            if entry is not None and entry["stat"] == file_stat:
+                if entry["meta"] is not None:
+                    entry["meta"]["file"] = gpx_file
+                entries[gpx_file.name] = entry
+            else:
+                entries[gpx_file.name] = {"stat": file_stat, "meta": None}
+                stale_files.append(gpx_file)
+
+        logger.debug("GPX index: %d files from cache, %d to parse", len(gpx_files) - len(stale_files), len(stale_files))
+
+        results = self._build_index_entries(stale_files)
+
+        for gpx_file, metadata in zip(stale_files, results, strict=True):
+            entries[gpx_file.name]["meta"] = metadata
+
+        # Keep the directory order of the files, so ties in the searches resolve as before
+        for filename, entry in entries.items():
+            if entry["meta"] is not None:
+                self.gpx_index[filename] = entry["meta"]
+
+        self._bbox_table = None
+        self._point_strip = None
+
+        if stale_files or entries.keys() != cached_entries.keys():
+            if save_pickle_cache(cache_file, entries):
+                self._remove_outdated_index_caches(cache_file)
+            else:
+                logger.debug("Could not write GPX index cache to %s", cache_file)
+
+    @staticmethod
+    def _remove_outdated_index_caches(cache_file: Path) -> None:
+        """Removes GPX index caches of other cache versions next to the current one.
 
-        def process_file(gpx_file: Path) -> tuple[str, dict[str, Any]] | None:
+        Args:
+            cache_file: Path of the current GPX index cache.
+        """
+        for outdated in cache_file.parent.glob("gpx_index_v*.pkl"):
+            if outdated != cache_file:
+                try:
+                    outdated.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.debug("Could not remove outdated GPX index cache %s: %s", outdated, e)
+
+    def _build_index_entries(self, gpx_files: list[Path]) -> list[dict[str, Any] | None]:
+        """Builds the GPX index entries for several files.
+
+        Parsing is CPU-bound, so larger batches are spread over one worker
+        process per core. Small batches are parsed in-process, where starting
+        the worker processes would cost more than it saves.
+
+        Args:
+            gpx_files: Paths to the GPX files.
+
+        Returns:
+            One entry per file in the same order, see `_build_index_entry`.
+        """
+        if len(gpx_files) >= GPX_INDEX_PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    return list(executor.map(self._build_index_entry, gpx_files, chunksize=4))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel GPX indexing failed ({e}), parsing files sequentially")
+
+        return [self._build_index_entry(gpx_file) for gpx_file in gpx_files]
+
+    @staticmethod
+    def _build_index_entry(gpx_file: Path) -> dict[str, Any] | None:
+        """Reads a GPX file and builds its GPX index entry.
+
+        The track points are stored as one structured array (see
+        `make_point_records`), together with the start and end point (also
+        in radians, see `to_radian_point`), the bounding box and the track
+        statistics.
+
+        Args:
+            gpx_file: Path to the GPX file.
+
+        Returns:
+            Metadata dictionary for the GPX index, or None if the file cannot
+            be read or contains no track points.
+        """
+        track = read_gpx_points_fast(gpx_file)
+        if track is None:
+            # Fall back to gpxpy with its encoding handling
             gpx = read_gpx_file(gpx_file)
             if gpx is None or not gpx.tracks:
                 return None
+            track = gpx_point_arrays(gpx)
 
-            first_point = None
-            last_point = None
-            all_points = []
-
-            point_index = 0
-            for track in gpx.tracks:
-                for seg in track.segments:
-                    for p in seg.points:
-                        if first_point is None:
-                            first_point = p
-                        last_point = p
-                        all_points.append(
-                            {"lat": p.latitude, "lon": p.longitude, "elevation": p.elevation, "index": point_index}
-                        )
-                        point_index += 1
-
-            max_elevation, total_distance, total_ascent, total_descent = get_statistics4track(gpx)
-
-            if first_point is None or last_point is None:
-                return None
+        lats, lons, elevations = track
+        if len(lats) == 0:
+            return None
 
-            return gpx_file.name, {
-                "file": gpx_file,
-                "start_lat": first_point.latitude,
-                "start_lon": first_point.longitude,
-                "end_lat": last_point.latitude,
-                "end_lon": last_point.longitude,
-                "total_distance_m": total_distance,
-                "total_ascent_m": total_ascent,
-                "max_elevation_m": (int(round(max_elevation)) if max_elevation != float("-inf") else None),
-                "points": all_points,
-            }
+        # Statistics on the full-precision elevations, before they are stored as float32
+        max_elevation, total_distance, total_ascent, total_descent = get_statistics4points(
+            np.rec.fromarrays([lats, lons, elevations], names="lat,lon,elevation")
+        )
+        points = make_point_records(lats, lons, elevations)
+
+        return {
+            "file": gpx_file,
+            "start_lat": float(lats[0]),
+            "start_lon": float(lons[0]),
+            "end_lat": float(lats[-1]),
+            "end_lon": float(lons[-1]),
+            "start_rad": to_radian_point(lats[0], lons[0]),
+            "end_rad": to_radian_point(lats[-1], lons[-1]),
+            "total_distance_m": total_distance,
+            "total_ascent_m": total_ascent,
+            "max_elevation_m": (int(round(max_elevation)) if max_elevation != float("-inf") else None),
+            "points": points,
+            "bbox": get_bounding_box(points),
+        }
+
+    def _files_near(self, lat: float, lon: float, radius_m: float) -> list[str]:
+        """Returns the indexed files whose bounding box may lie within a radius.
+
+        The bounding boxes of all index entries are kept stacked in one array,
+        so the prefilter of the track searches is a single vectorized check per
+        query instead of one `is_near_bounding_box` call per file.
+
+        Args:
+            lat: Latitude of the query position.
+            lon: Longitude of the query position.
+            radius_m: Search radius in meters.
+
+        Returns:
+            Filenames in index order that passed the check.
+        """
+        if self._bbox_table is None or len(self._bbox_table[0]) != len(self.gpx_index):
+            names = list(self.gpx_index)
+            bboxes = np.array([self.gpx_index[name]["bbox"] for name in names], dtype=np.float64).reshape(-1, 4)
+            self._bbox_table = (names, bboxes)
+
+        names, bboxes = self._bbox_table
+        return [names[i] for i in np.flatnonzero(are_near_bounding_boxes(bboxes, lat, lon, radius_m))]
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            results = executor.map(process_file, gpx_files)
+    def _closest_points_near(self, lat: float, lon: float, max_distance_m: float) -> list[tuple[str, int, float]]:
+        """Returns the closest point of every indexed track near a position.
 
-        for result in results:
-            if result:
-                filename, metadata = result
-                self.gpx_index[filename] = metadata
+        Uses a grid-sorted index over the points of all tracks (see
+        `build_point_strip`), which is built on first use and after changes
+        to the GPX index.
+
+        Args:
+            lat: Latitude of the query position.
+            lon: Longitude of the query position.
+            max_distance_m: Distance limit in meters.
+
+        Returns:
+            List of (filename, index, distance) in index order, see
+            `find_closest_point_per_track`.
+        """
+        if self._point_strip is None or len(self._point_strip[0]) != len(self.gpx_index):
+            names = list(self.gpx_index)
+            self._point_strip = (names, build_point_strip([self.gpx_index[name]["points"] for name in names]))
+
+        names, strip = self._point_strip
+        return [
+            (names[owner], idx, dist) for owner, idx, dist in find_closest_point_per_track(strip, lat, lon, max_distance_m)
+        ]
 
     def _find_start_pos(
         self,
@@ -214,15 +374,20 @@ class GPXRouteManager:
 
         candidates = []
         start_radius_m = self.start_search_radius_km * 1000
+        target_rad = to_radian_point(target_lat, target_lon)
 
-        for filename, meta in self.gpx_index.items():
-            idx, dist_to_start = find_closest_point_in_track(meta["points"], start_lat, start_lon)
+        for filename in self._files_near(start_lat, start_lon, start_radius_m):
+            meta = self.gpx_index[filename]
+            idx, dist_to_start = find_closest_point_in_records(
+                meta["points"], start_lat, start_lon, max_distance_m=start_radius_m
+            )
             if dist_to_start > start_radius_m:
                 continue
 
-            dist_track_start_to_target = haversine(meta["start_lat"], meta["start_lon"], target_lat, target_lon)
-            dist_track_end_to_target = haversine(meta["end_lat"], meta["end_lon"], target_lat, target_lon)
-            min_dist_to_target = min(dist_track_start_to_target, dist_track_end_to_target)
+            # Compare the Haversine terms and convert only the closer endpoint into meters
+            min_dist_to_target = haversine_term_to_m(
+                min(haversine_rad_term(meta["start_rad"], target_rad), haversine_rad_term(meta["end_rad"], target_rad))
+            )
 
             candidates.append(
                 {"filename": filename, "index": idx, "dist_to_start": dist_to_start, "dist_to_target": min_dist_to_target}
@@ -285,8 +450,23 @@ class GPXRouteManager:
         end_point = None
         target_radius_m = self.target_search_radius_km * 1000
 
-        for filename, meta in self.gpx_index.items():
-            idx, dist = find_closest_point_in_track(meta["points"], target_lat, target_lon)
+        # Visit files by their bounding box distance, so the search can stop as
+        # soon as no remaining box can hold a point closer than the best one.
+        # The sort is stable, so files at equal box distance keep the index order.
+        candidates = [
+            (bounding_box_min_distance(self.gpx_index[filename]["bbox"], target_lat, target_lon), filename)
+            for filename in self._files_near(target_lat, target_lon, target_radius_m)
+        ]
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        for box_distance, filename in candidates:
+            if box_distance > target_distance:
+                break
+
+            meta = self.gpx_index[filename]
+            idx, dist = find_closest_point_in_records(
+                meta["points"], target_lat, target_lon, max_distance_m=min(target_radius_m, target_distance)
+            )
             if dist < target_distance and dist <= target_radius_m:
                 target_distance = dist
                 target_file = filename
@@ -298,8 +478,11 @@ class GPXRouteManager:
             logger.warning(f"⚠️  No target track found within {self.target_search_radius_km}km!")
             return None, None, None, None
 
-        dist_to_start = haversine(start_lat, start_lon, start_point["lat"], start_point["lon"])
-        dist_to_end = haversine(start_lat, start_lon, end_point["lat"], end_point["lon"])
+        target_meta = self.gpx_index[target_file]
+        start_rad = to_radian_point(start_lat, start_lon)
+        # Only the order matters here, so the Haversine terms suffice
+        dist_to_start = haversine_rad_term(start_rad, target_meta["start_rad"])
+        dist_to_end = haversine_rad_term(start_rad, target_meta["end_rad"])
 
         if dist_to_start < dist_to_end:
             target_side_lat = start_point["lat"]
@@ -342,15 +525,14 @@ class GPXRouteManager:
         best_idx = current_index
         best_dist = float("inf")
 
-        for point in meta["points"]:
-            if force_direction == "forward" and point["index"] <= current_index:
-                continue
-            if force_direction == "backward" and point["index"] >= current_index:
-                continue
-            dist = haversine(target_side_lat, target_side_lon, point["lat"], point["lon"])
-            if dist < best_dist:
-                best_dist = dist
-                best_idx = point["index"]
+        points = meta["points"]
+        if force_direction == "forward":
+            points = points[current_index + 1 :]
+        elif force_direction == "backward":
+            points = points[:current_index]
+
+        if len(points):
+            best_idx, best_dist = find_closest_point_in_track(points, target_side_lat, target_side_lon)
 
         if self.verbose:
             direction_str = "Forward" if force_direction == "forward" else "Backward"
@@ -406,6 +588,9 @@ class GPXRouteManager:
     ) -> tuple[float, float, float, float]:
         """Calculates statistics for a track section between two indices.
 
+        Works on the flat point array stored in the GPX index, so the GPX file
+        does not have to be parsed again.
+
         Args:
             meta: Metadata of the GPX track.
             current_index: Start index of the section.
@@ -423,12 +608,11 @@ class GPXRouteManager:
         mystart_index = min(current_index, end_index)
         myend_index = max(current_index, end_index)
 
-        gpx = read_gpx_file(meta["file"])
-        if gpx:
-            return get_statistics4track(
-                gpx, mystart_index, myend_index, max_elevation, total_distance, total_ascent, total_descent, reversed_direction
-            )
-        return max_elevation, total_distance, total_ascent, total_descent
+        pts = meta["points"][mystart_index : myend_index + 1]
+        if reversed_direction:
+            pts = pts[::-1]
+
+        return get_statistics4points(pts, max_elevation, total_distance, total_ascent, total_descent)
 
     def _find_next_gpx_file(
         self,
@@ -459,13 +643,12 @@ class GPXRouteManager:
         if self.verbose:
             logger.debug("   Searching for next GPX file...")
 
-        for name, meta in self.gpx_index.items():
+        for name, idx, dist in self._closest_points_near(current_lat, current_lon, self.max_connection_distance_m):
             if name in visited:
                 continue
             if get_base_filename(name) in used_base_files:
                 continue
-
-            idx, dist = find_closest_point_in_track(meta["points"], current_lat, current_lon)
+            meta = self.gpx_index[name]
 
             if self.verbose:
                 logger.debug(f"      {meta['total_distance_m']:.0f}m {name} {dist:.1f}m")
@@ -597,25 +780,25 @@ class GPXRouteManager:
         """
         # Validations
         if current.file in context.visited:
-            logger.debug(f"⚠️  Iteration {context.iteration + 1}: File {current.file} already visited - aborting")
+            logger.debug("⚠️  Iteration %d: File %s already visited - aborting", context.iteration + 1, current.file)
             return False, None, stats
 
         meta = self.gpx_index.get(current.file)
         if not meta:
-            logger.debug(f"⚠️  Iteration {context.iteration + 1}: No metadata for {current.file} - aborting")
+            logger.debug("⚠️  Iteration %d: No metadata for %s - aborting", context.iteration + 1, current.file)
             return False, None, stats
 
         base_name = get_base_filename(current.file)
         if base_name in context.used_base_files:
-            logger.debug(f"⚠️  Iteration {context.iteration + 1}: Base file {base_name} already used - aborting")
+            logger.debug("⚠️  Iteration %d: Base file %s already used - aborting", context.iteration + 1, base_name)
             return False, None, stats
 
-        logger.debug(f"📁 Iteration {context.iteration + 1}: {current.file} (current index: {current.index})")
+        logger.debug("📁 Iteration %d: %s (current index: %s)", context.iteration + 1, current.file, current.index)
 
         # Determine end index
         if current.file == context.target.file:
             end_index = context.target.index
-            logger.debug(f"   ✅ Target file reached! Going to index {end_index}")
+            logger.debug("   ✅ Target file reached! Going to index %s", end_index)
             should_stop = True
         else:
             end_index = self._set_end_index(
@@ -625,8 +808,7 @@ class GPXRouteManager:
 
         # Determine direction
         reversed_dir = current.index > end_index
-        direction_str = "backward" if reversed_dir else "forward"
-        logger.debug(f"   Direction: {direction_str} (Index {current.index} -> {end_index})")
+        logger.debug("   Direction: %s (Index %s -> %s)", "backward" if reversed_dir else "forward", current.index, end_index)
 
         # Mark as visited
         context.visited.add(current.file)
@@ -654,32 +836,27 @@ class GPXRouteManager:
         stats.total_descent = desc
 
         # Surface statistics (only possible for BRouter segments)
-        # However, our local GPX tracks don't have surface info easily.
-        # But we could try to call BRouter for the coordinates.
-        try:
-            pt_start = meta["points"][current.index]
-            pt_end = meta["points"][end_index]
-            _, surf_stats = get_route2address_with_stats(pt_start["lat"], pt_start["lon"], pt_end["lat"], pt_end["lon"])
-            stats.paved_distance += surf_stats["paved"]
-            stats.unpaved_distance += surf_stats["unpaved"]
-            stats.other_distance += surf_stats["other"]
-        except Exception as e:
-            logger.warning(f"Could not fetch surface stats for segment: {e}")
+        # Our local GPX tracks don't have surface info, so BRouter is queried for the
+        # section's start and end coordinates. The requests are independent of the chain
+        # search and are issued in one concurrent batch once the route is complete.
+        pt_start = meta["points"][current.index]
+        pt_end = meta["points"][end_index]
+        context.surface_segments.append((pt_start["lat"], pt_start["lon"], pt_end["lat"], pt_end["lon"]))
 
         # Update position
         end_pt = meta["points"][end_index]
         current_lat, current_lon = end_pt["lat"], end_pt["lon"]
-        logger.debug(f"   New position: ({current_lat:.6f}, {current_lon:.6f})")
+        logger.debug("   New position: (%.6f, %.6f)", current_lat, current_lon)
 
         if should_stop:
-            print("✅ Target reached!")
+            logger.debug("✅ Target reached!")
             return False, None, stats
 
         # Find next GPX
         next_file, next_index = self._find_next_gpx_file(context.visited, context.used_base_files, current_lat, current_lon)
 
         if not next_file:
-            logger.debug(f"⚠️  No suitable next GPX found (max distance: {self.max_connection_distance_m}m)")
+            logger.debug("⚠️  No suitable next GPX found (max distance: %sm)", self.max_connection_distance_m)
             if context.target.file not in context.visited:
                 self._add_target_track_to_route(
                     context.target.file, context.target.index, current_lat, current_lon, context.route_files
@@ -690,6 +867,39 @@ class GPXRouteManager:
         next_pos = RoutePosition(file=next_file, index=next_index, lat=next_pt["lat"], lon=next_pt["lon"])
         return True, next_pos, stats
 
+    def _add_surface_statistics(
+        self, surface_segments: list[tuple[float, float, float, float]], stats: RouteStatistics
+    ) -> None:
+        """Fetches BRouter surface statistics for all traversed track sections.
+
+        The BRouter requests are independent I/O, so they are issued concurrently
+        over the shared keep-alive session of the brouter module. Sections for which
+        the request fails are skipped with a warning.
+
+        Args:
+            surface_segments: Start/end coordinates (lat, lon, lat, lon) per section.
+            stats: Route statistics to be updated with paved/unpaved/other distances.
+        """
+        if not surface_segments:
+            return
+
+        def fetch(coords: tuple[float, float, float, float]) -> dict[str, float] | None:
+            try:
+                _, surf_stats = get_route2address_with_stats(*coords)
+                return {key: surf_stats[key] for key in ("paved", "unpaved", "other")}
+            except Exception as e:
+                logger.warning(f"Could not fetch surface stats for segment: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=BROUTER_MAX_PARALLEL_REQUESTS) as executor:
+            results = list(executor.map(fetch, surface_segments))
+
+        for surf_stats in results:
+            if surf_stats:
+                stats.paved_distance += surf_stats["paved"]
+                stats.unpaved_distance += surf_stats["unpaved"]
+                stats.other_distance += surf_stats["other"]
+
     def _add_target_track_to_route(
         self,
         target_file: str,
@@ -714,8 +924,9 @@ class GPXRouteManager:
         logger.debug(f"   ➕ Adding target track: {target_file}")
         meta = self.gpx_index[target_file]
 
-        dist_to_start = haversine(current_lat, current_lon, meta["points"][0]["lat"], meta["points"][0]["lon"])
-        dist_to_end = haversine(current_lat, current_lon, meta["points"][-1]["lat"], meta["points"][-1]["lon"])
+        current_rad = to_radian_point(current_lat, current_lon)
+        dist_to_start = haversine_rad_term(current_rad, meta["start_rad"])
+        dist_to_end = haversine_rad_term(current_rad, meta["end_rad"])
 
         if dist_to_end < dist_to_start:
             start_idx = len(meta["points"]) - 1
@@ -756,11 +967,11 @@ class GPXRouteManager:
             previous_last_file: Optional. Dictionary of the last used GPX file
                                from the previous day.
         """
-        logger.info(f"\n{'=' * 80}")
-        logger.info(f"Route search: ({start_lat:.6f}, {start_lon:.6f}) -> ({target_lat:.6f}, {target_lon:.6f})")
+        logger.info("\n%s", "=" * 80)
+        logger.info("Route search: (%.6f, %.6f) -> (%.6f, %.6f)", start_lat, start_lon, target_lat, target_lon)
         if previous_last_file:
-            logger.info(f"🔗 Continuation from: {previous_last_file['file']} (Index {previous_last_file['end_index']})")
-        logger.info(f"{'=' * 80}")
+            logger.info("🔗 Continuation from: %s (Index %s)", previous_last_file["file"], previous_last_file["end_index"])
+        logger.info("%s", "=" * 80)
 
         start_file, start_idx, force_dir = self._find_start_pos(
             start_lat, start_lon, target_lat, target_lon, previous_last_file
@@ -788,12 +999,18 @@ class GPXRouteManager:
             if not should_continue:
                 break
 
-        logger.info("\n📊 Summary:")
-        logger.info(f"   Files: {len(context.route_files)}")
-        logger.info(f"   Total distance: {stats.total_distance / 1000:.2f} km")
-        logger.info(f"   Total ascent: {stats.total_ascent:.0f} m")
-        logger.info(f"   Max elevation: {stats.max_elevation:.0f} m" if stats.max_elevation != 0 else "   Max elevation: N/A")
-        logger.info(f"{'=' * 80}\n")
+        self._add_surface_statistics(context.surface_segments, stats)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n📊 Summary:")
+            logger.info("   Files: %d", len(context.route_files))
+            logger.info("   Total distance: %.2f km", stats.total_distance / 1000)
+            logger.info("   Total ascent: %.0f m", stats.total_ascent)
+            if stats.max_elevation != 0:
+                logger.info("   Max elevation: %.0f m", stats.max_elevation)
+            else:
+                logger.info("   Max elevation: N/A")
+            logger.info("%s\n", "=" * 80)
 
         booking["gpx_files"] = context.route_files
         booking["total_distance_km"] = round(stats.total_distance / 1000, 2)
@@ -823,12 +1040,7 @@ class GPXRouteManager:
             logger.warning(f"route_files is empty or None: {route_files}")
             return None
 
-        merged_gpx = gpxpy.gpx.GPX()
-        track = gpxpy.gpx.GPXTrack()
-        merged_gpx.tracks.append(track)
-        segment = gpxpy.gpx.GPXTrackSegment()
-        track.segments.append(segment)
-
+        sections = []
         for i, entry in enumerate(route_files):
             if i == len(route_files) - 1 and entry.get("is_to_hotel"):
                 gpx_file = output_dir / entry["file"]
@@ -841,7 +1053,7 @@ class GPXRouteManager:
                 logger.warning(f"⚠️  File not found: {entry['file']}")
                 continue
 
-            gpx = read_gpx_file(gpx_file)
+            gpx = read_gpx_file_cached(gpx_file)
             if not gpx or not gpx.tracks:
                 continue
 
@@ -850,20 +1062,12 @@ class GPXRouteManager:
             if rev:
                 s_idx, e_idx = e_idx, s_idx
 
-            all_pts = []
-            cnt = 0
-            for trk in gpx.tracks:
-                for seg in trk.segments:
-                    for p in seg.points:
-                        if s_idx <= cnt <= e_idx:
-                            all_pts.append(p)
-                        cnt += 1
+            all_pts = get_track_points(gpx, s_idx, e_idx)
 
             if rev:
-                all_pts = all_pts[::-1]
+                all_pts = reversed(all_pts)
 
-            for p in all_pts:
-                segment.points.append(gpxpy.gpx.GPXTrackPoint(p.latitude, p.longitude, elevation=p.elevation, time=p.time))
+            sections.append(all_pts)
 
         output_dir.mkdir(parents=True, exist_ok=True)
         date_str = booking.get("arrival_date", "unknown_date")
@@ -873,7 +1077,7 @@ class GPXRouteManager:
 
         out_name = f"{date_str}_{hotel_name_clean}_merged.gpx"
         out_path = output_dir / out_name
-        out_path.write_text(merged_gpx.to_xml(), encoding="utf-8")
+        write_gpx_track(out_path, chain.from_iterable(sections))
 
         booking["gpx_track_final"] = out_name
         logger.info(f"💾 Merged GPX saved: {out_path.name}")
@@ -913,38 +1117,19 @@ class GPXRouteManager:
             if not gpx_file.exists():
                 gpx_file = output_path / last_seg["file"]
 
-            gpx = read_gpx_file(gpx_file)
+            gpx = read_gpx_file_cached(gpx_file)
             if not gpx:
                 logger.error(f"Could not read {gpx_file.name}")
                 return None
 
-            extended_gpx = gpxpy.gpx.GPX()
-            track = gpxpy.gpx.GPXTrack()
-            extended_gpx.tracks.append(track)
-            segment = gpxpy.gpx.GPXTrackSegment()
-            track.segments.append(segment)
-
             s_idx, e_idx, rev = last_seg.get("start_index", 0), last_seg["end_index"], last_seg.get("reversed", False)
-            pts = []
-            cnt = 0
-            m_idx, ma_idx = min(s_idx, e_idx), max(s_idx, e_idx)
-            for trk in gpx.tracks:
-                for seg in trk.segments:
-                    for p in seg.points:
-                        if m_idx <= cnt <= ma_idx:
-                            pts.append(p)
-                        cnt += 1
+            pts = get_track_points(gpx, min(s_idx, e_idx), max(s_idx, e_idx))
             if rev:
-                pts = pts[::-1]
-
-            for p in pts:
-                segment.points.append(gpxpy.gpx.GPXTrackPoint(p.latitude, p.longitude, elevation=p.elevation, time=p.time))
+                pts.reverse()
 
             new_pts, surf_stats = get_route2address_with_stats(
                 pts[-1].latitude, pts[-1].longitude, booking["latitude"], booking["longitude"]
             )
-            for p in new_pts:
-                segment.points.append(gpxpy.gpx.GPXTrackPoint(p.latitude, p.longitude, elevation=p.elevation, time=p.time))
 
             # Update surface statistics for the extension
             try:
@@ -975,18 +1160,18 @@ class GPXRouteManager:
 
             out_name = f"{date_str}_{hotel_name_clean}_to_hotel.gpx"
             out_file = output_path / out_name
-            out_file.write_text(extended_gpx.to_xml(), encoding="utf-8")
+            num_points = write_gpx_track(out_file, chain(pts, new_pts))
 
             booking["gpx_files"][-1] = {
                 "file": out_name,
                 "start_index": 0,
-                "end_index": len(segment.points) - 1,
+                "end_index": num_points - 1,
                 "reversed": False,
                 "is_to_hotel": True,
             }
-            booking["_last_gpx_file"] = {"file": out_name, "end_index": len(segment.points) - 1, "reversed": False}
+            booking["_last_gpx_file"] = {"file": out_name, "end_index": num_points - 1, "reversed": False}
 
-            logger.info(f"   ✅ Hotel point added. Total: {len(segment.points)} points")
+            logger.info(f"   ✅ Hotel point added. Total: {num_points} points")
             logger.info(f"   💾 Saved as: {out_name}")
 
             return out_file
@@ -1001,52 +1186,17 @@ class GPXRouteManager:
             old_filename: Filename of the entry to be replaced.
             new_gpx_file: Path to the new GPX file.
         """
+        self._bbox_table = None
+        self._point_strip = None
         if old_filename in self.gpx_index:
             del self.gpx_index[old_filename]
             logger.debug(f"   🗑️  Old entry '{old_filename}' removed from index")
 
-        gpx = read_gpx_file(new_gpx_file)
-        if not gpx or not gpx.tracks:
+        metadata = self._build_index_entry(new_gpx_file)
+        if metadata is None:
             logger.warning(f"   ⚠️  Could not read new file '{new_gpx_file.name}'")
             return
 
-        total_distance = 0.0
-        total_ascent = 0.0
-        max_elevation = float("-inf")
-        first_point = None
-        last_point = None
-        all_points = []
-        point_index = 0
-
-        for track in gpx.tracks:
-            for seg in track.segments:
-                prev = None
-                for p in seg.points:
-                    if first_point is None:
-                        first_point = p
-                    last_point = p
-                    all_points.append({"lat": p.latitude, "lon": p.longitude, "elevation": p.elevation, "index": point_index})
-                    point_index += 1
-                    if p.elevation is not None:
-                        max_elevation = max(max_elevation, p.elevation)
-                    if prev:
-                        d = haversine(prev.latitude, prev.longitude, p.latitude, p.longitude)
-                        total_distance += d
-                        if prev.elevation is not None and p.elevation is not None and p.elevation > prev.elevation:
-                            total_ascent += p.elevation - prev.elevation
-                    prev = p
-
-        if first_point and last_point:
-            self.gpx_index[new_gpx_file.name] = {
-                "file": new_gpx_file,
-                "start_lat": first_point.latitude,
-                "start_lon": first_point.longitude,
-                "end_lat": last_point.latitude,
-                "end_lon": last_point.longitude,
-                "total_distance_m": total_distance,
-                "total_ascent_m": total_ascent,
-                "max_elevation_m": (int(round(max_elevation)) if max_elevation != float("-inf") else None),
-                "points": all_points,
-            }
-            logger.info(f"   ✅ New entry '{new_gpx_file.name}' added to index")
-            logger.debug(f"      Points: {len(all_points)}, Distance: {total_distance / 1000:.2f} km")
+        self.gpx_index[new_gpx_file.name] = metadata
+        logger.info(f"   ✅ New entry '{new_gpx_file.name}' added to index")
+        logger.debug(f"      Points: {len(metadata['points'])}, Distance: {metadata['total_distance_m'] / 1000:.2f} km")
@@ -1,11 +1,23 @@
 """Static helper functions for GPX route management."""
 
 import math
+import os
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from itertools import accumulate
+from math import atan2, cos, sin, sqrt
 from pathlib import Path
 
 import gpxpy
+import numpy as np
+from gpxpy.gpxfield import format_time
+from lxml import etree
 
-from .elevation_calc import calculate_elevation_gain_segment_based, calculate_elevation_gain_smoothed
+from .constants import EARTH_RADIUS_M
+from .elevation_calc import calculate_elevation_gain_loss
 from .logger import get_logger
 
 # Initialize Logger
@@ -13,6 +25,40 @@ logger = get_logger()
 
 TrackStats = tuple[float, float, float, float]
 
+# Factor of math.radians, for the scalar Haversine hot path
+_DEG_TO_RAD = math.pi / 180.0
+
+# Safety factor when rejecting candidates on approximate distances
+EQUIRECTANGULAR_MARGIN = 1.1
+
+# Largest Haversine term for which haversine_vec uses the arcsine series
+HAVERSINE_SERIES_MAX_TERM = 0.01
+
+BoundingBox = tuple[float, float, float, float]
+
+# GPX file with its size and modification time: (path, st_size, st_mtime_ns)
+GPXFileStat = tuple[Path, int, int]
+
+# Point in radians with the cosine of its latitude: (phi, lambda, cos(phi))
+RadianPoint = tuple[float, float, float]
+
+# Height of the latitude rows of the point grid in degrees (about 1.1 km)
+POINT_GRID_ROW_DEG = 0.01
+
+# Points of many tracks in latitude rows, each row sorted by longitude:
+# (lats, lons, owners, indices, row_ids, row_starts)
+PointStrip = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# Layout of the per-file point arrays stored in the GPX index
+POINT_DTYPE = np.dtype([("lat", np.float64), ("lon", np.float64), ("elevation", np.float32), ("index", np.int64)])
+
+# Full-precision point layout for computing statistics
+_STATS_DTYPE = np.dtype([("lat", np.float64), ("lon", np.float64), ("elevation", np.float64)])
+
+GPX_NAMESPACE = "http://www.topografix.com/GPX/1/1"
+
+_DIRECTION_SUFFIX_RE = re.compile(r"_(?:inverted|reversed|rev|inverse|backward)\.gpx$", re.IGNORECASE)
+
 
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculates the distance between two coordinates in meters.
@@ -34,19 +80,175 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         >>> print(f"{distance / 1000:.1f} km")
         504.2 km
     """
-    R = 6371000
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-    return 2 * R * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # Same operations as with math.radians, without the extra calls and attribute lookups
+    a = (
+        sin((lat2 - lat1) * _DEG_TO_RAD / 2) ** 2
+        + cos(lat1 * _DEG_TO_RAD) * cos(lat2 * _DEG_TO_RAD) * sin((lon2 - lon1) * _DEG_TO_RAD / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * atan2(sqrt(a), sqrt(1 - a))
+
+
+def to_radian_point(lat: float, lon: float) -> RadianPoint:
+    """Converts a coordinate for repeated use with `haversine_rad`.
+
+    Args:
+        lat: Latitude in decimal degrees.
+        lon: Longitude in decimal degrees.
+
+    Returns:
+        Tuple of (latitude in radians, longitude in radians, cosine of the latitude).
+    """
+    phi = math.radians(lat)
+    return phi, math.radians(lon), math.cos(phi)
+
+
+def haversine_rad(p1: RadianPoint, p2: RadianPoint) -> float:
+    """Calculates the Haversine distance between two precomputed points in meters.
+
+    Same formula as `haversine`, but the degree-to-radian conversions and the
+    latitude cosines are taken from `to_radian_point`. Loops that compare many
+    points against one fixed position convert that position only once.
+
+    Args:
+        p1: First point as returned by `to_radian_point`.
+        p2: Second point as returned by `to_radian_point`.
+
+    Returns:
+        The distance in meters.
+    """
+    return haversine_term_to_m(haversine_rad_term(p1, p2))
+
+
+def haversine_rad_term(p1: RadianPoint, p2: RadianPoint) -> float:
+    """Computes the inner Haversine term ``a`` between two precomputed points.
+
+    The distance grows strictly with ``a``, so callers that only compare
+    distances can compare this term and skip the square roots and the
+    arctangent; see `haversine_term_to_m` for the conversion into meters.
+
+    Args:
+        p1: First point as returned by `to_radian_point`.
+        p2: Second point as returned by `to_radian_point`.
+
+    Returns:
+        The Haversine term of the two points.
+    """
+    phi1, lambda1, cos_phi1 = p1
+    phi2, lambda2, cos_phi2 = p2
+    return math.sin((phi2 - phi1) / 2) ** 2 + cos_phi1 * cos_phi2 * math.sin((lambda2 - lambda1) / 2) ** 2
+
+
+def haversine_term_to_m(a: float) -> float:
+    """Converts an inner Haversine term into a distance in meters.
+
+    Args:
+        a: Haversine term as returned by `haversine_rad_term` or
+            `_haversine_term`.
+
+    Returns:
+        The distance in meters.
+    """
+    return 2 * EARTH_RADIUS_M * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def haversine_vec(
+    lat1: np.ndarray | float, lon1: np.ndarray | float, lat2: np.ndarray | float, lon2: np.ndarray | float
+) -> np.ndarray:
+    """Vectorized Haversine distance between coordinate arrays in meters.
+
+    Same formula as `haversine`, evaluated element-wise with NumPy. The
+    arguments are broadcast against each other, so a single point can be
+    compared against a whole array of points in one call. Inputs of lower
+    precision are promoted to float64 before the computation.
+
+    The arcsine is replaced by a short polynomial for the short arcs between
+    neighbouring track points, which only takes a few multiply-adds per point.
+    Longer arcs use the exact formula.
+
+    Args:
+        lat1: Latitude(s) of the first point(s) in decimal degrees.
+        lon1: Longitude(s) of the first point(s) in decimal degrees.
+        lat2: Latitude(s) of the second point(s) in decimal degrees.
+        lon2: Longitude(s) of the second point(s) in decimal degrees.
+
+    Returns:
+        Array with the distances in meters.
+
+    Example:
+        >>> lats = np.array([48.0, 48.1, 48.2])
+        >>> lons = np.array([11.0, 11.1, 11.2])
+        >>> haversine_vec(lats[:-1], lons[:-1], lats[1:], lons[1:]).sum()
+    """
+    a = _haversine_term(lat1, lon1, lat2, lon2)
+    sqrt_a = np.sqrt(a)
+    # Taylor series of asin(sqrt(a)) in Horner form; the truncation error stays
+    # below a millimeter up to HAVERSINE_SERIES_MAX_TERM (about 1270 km)
+    c = sqrt_a * (1.0 + a * (1 / 6 + a * (3 / 40 + a * (15 / 336))))
+    large = a >= HAVERSINE_SERIES_MAX_TERM
+    if large.any():
+        c = np.where(large, np.arctan2(sqrt_a, np.sqrt(1 - a)), c)
+    return 2 * EARTH_RADIUS_M * c
+
+
+def _haversine_term(
+    lat1: np.ndarray | float, lon1: np.ndarray | float, lat2: np.ndarray | float, lon2: np.ndarray | float
+) -> np.ndarray:
+    """Computes the inner Haversine term ``a`` element-wise.
+
+    The distance grows strictly with ``a``, so nearest-point searches can take
+    the argmin of this term and convert only the winner into meters.
+
+    Args:
+        lat1: Latitude(s) of the first point(s) in decimal degrees.
+        lon1: Longitude(s) of the first point(s) in decimal degrees.
+        lat2: Latitude(s) of the second point(s) in decimal degrees.
+        lon2: Longitude(s) of the second point(s) in decimal degrees.
+
+    Returns:
+        Array with the Haversine term for each pair of points.
+    """
+    phi1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    phi2 = np.radians(np.asarray(lat2, dtype=np.float64))
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lon2, dtype=np.float64)) - np.radians(np.asarray(lon1, dtype=np.float64))
+    return np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+
+
+def scan_gpx_files(gpx_dir: Path) -> list[GPXFileStat]:
+    """Lists the GPX files of a directory together with their size and mtime.
+
+    Uses ``os.scandir``, whose entries already carry the file name and type,
+    instead of ``Path.glob``, which builds and matches a `Path` per entry.
+    The files are returned in directory order, the same order as
+    ``Path.glob("*.gpx")``. The extension is matched case-insensitively on
+    every platform, so ``.GPX`` files are found as they are on Windows.
+
+    Args:
+        gpx_dir: Directory containing the GPX files.
+
+    Returns:
+        List of (path, size, mtime_ns) for every regular GPX file. Like
+        ``Path.glob``, an empty list if the directory cannot be read.
+    """
+    files = []
+    try:
+        with os.scandir(gpx_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(".gpx") and entry.is_file():
+                    stat = entry.stat()
+                    files.append((Path(entry.path), stat.st_size, stat.st_mtime_ns))
+    except OSError as e:
+        logger.debug("Could not list GPX files in %s: %s", gpx_dir, e)
+    return files
 
 
 def read_gpx_file(gpx_file: Path) -> gpxpy.gpx.GPX | None:
     """Reads a GPX file with robust encoding handling.
 
-    Tries different encoding strategies (UTF-8, Latin-1, CP1252) and
-    handles BOM (Byte Order Mark) and leading whitespaces.
+    Handles BOM (Byte Order Mark) and leading whitespaces. The file is read
+    from disk only once and decoded in memory: as UTF-8 if the bytes are
+    valid UTF-8, otherwise as Latin-1 and, if that does not parse either, as
+    UTF-8 without the invalid bytes.
 
     Args:
         gpx_file: Path to the GPX file.
@@ -54,56 +256,175 @@ def read_gpx_file(gpx_file: Path) -> gpxpy.gpx.GPX | None:
     Returns:
         The parsed GPX object or None on error.
     """
-    # Try different encoding strategies
-    encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
+    try:
+        content = gpx_file.read_bytes()
+    except OSError as e:
+        logger.error(f"Error reading {gpx_file.name}: {e}")
+        return None
+
+    # Remove BOM and leading whitespaces/newlines
+    content = content.removeprefix(b"\xef\xbb\xbf").lstrip()
+
+    # Valid UTF-8 decodes the same with and without errors="ignore", so it is parsed only once
+    try:
+        texts = [content.decode("utf-8")]
+    except UnicodeDecodeError:
+        # Latin-1 maps every byte, so no further single-byte encoding can decode more
+        texts = [content.decode("latin-1"), content.decode("utf-8", errors="ignore")]
 
-    for encoding in encodings:
+    error = None
+    for text in texts:
         try:
-            content = gpx_file.read_text(encoding=encoding)
+            return gpxpy.parse(text)
+        except Exception as e:
+            error = e
 
-            # Remove BOM if present
-            if content.startswith("\ufeff"):
-                content = content[1:]
+    logger.error(f"Error parsing {gpx_file.name}: {error}")
+    return None
 
-            # Remove leading whitespaces/newlines
-            content = content.lstrip()
 
-            # Parse GPX
-            gpx = gpxpy.parse(content)
-            return gpx
+def read_gpx_file_cached(gpx_file: Path) -> gpxpy.gpx.GPX | None:
+    """Reads a GPX file like `read_gpx_file`, reusing recently parsed files.
 
-        except (UnicodeDecodeError, gpxpy.gpx.GPXXMLSyntaxException):
-            continue
-        except Exception as e:
-            logger.error(f"Unexpected error reading {gpx_file.name}: {e}")
-            continue
+    The route merge and the extension to the accommodation both read the last
+    track of a day, so the second read can reuse the parsed object. Entries
+    are keyed by path, size and modification time, so changed files are
+    parsed again.
 
-    # If all encodings fail, try binary reading
+    Args:
+        gpx_file: Path to the GPX file.
+
+    Returns:
+        The parsed GPX object or None on error. The object is shared between
+        callers and must not be modified.
+    """
     try:
-        with open(gpx_file, "rb") as f:
-            content = f.read()
+        stat = gpx_file.stat()
+    except OSError as e:
+        logger.error(f"Error reading {gpx_file.name}: {e}")
+        return None
+    return _read_gpx_file_cached(gpx_file, stat.st_size, stat.st_mtime_ns)
 
-        # Try UTF-8 with error handling
-        text = content.decode("utf-8", errors="ignore")
 
-        # Remove BOM
-        if text.startswith("\ufeff"):
-            text = text[1:]
+@lru_cache(maxsize=8)
+def _read_gpx_file_cached(gpx_file: Path, size: int, mtime_ns: int) -> gpxpy.gpx.GPX | None:
+    """Cached backend of `read_gpx_file_cached`; size and mtime only serve as cache key."""
+    return read_gpx_file(gpx_file)
 
-        text = text.lstrip()
 
-        return gpxpy.parse(text)
+def read_gpx_points_fast(gpx_file: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Reads only the track point coordinates of a GPX file.
 
-    except Exception as e:
-        logger.error(f"Error parsing {gpx_file.name}: {e}")
+    Streams the file with ``lxml.etree.iterparse`` instead of building the full
+    gpxpy object tree, and releases each processed element right away. Suited
+    for callers that only need coordinates and elevations, such as the GPX
+    index.
+
+    Args:
+        gpx_file: Path to the GPX file.
+
+    Returns:
+        Tuple of (lats, lons, elevations) as float64 arrays in file order, with
+        NaN for missing elevations. None if the file cannot be parsed this way,
+        in which case callers should fall back to `read_gpx_file`.
+    """
+    lats = array("d")
+    lons = array("d")
+    elevations = array("d")
+
+    try:
+        for _, elem in etree.iterparse(str(gpx_file), events=("end",), tag="{*}trkpt"):
+            lats.append(float(elem.get("lat")))
+            lons.append(float(elem.get("lon")))
+            elevation = math.nan
+            for child in elem:
+                # Comments and processing instructions have no string tag
+                if not isinstance(child.tag, str):
+                    continue
+                if child.tag == "ele" or child.tag.endswith("}ele"):
+                    try:
+                        elevation = float(child.text)
+                    except (TypeError, ValueError):
+                        pass
+                    break
+            elevations.append(elevation)
+
+            # Free processed points to keep memory flat on large files
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except (OSError, etree.XMLSyntaxError, TypeError, ValueError) as e:
+        logger.debug("Fast GPX reader failed for %s: %s", gpx_file.name, e)
         return None
 
+    return np.frombuffer(lats), np.frombuffer(lons), np.frombuffer(elevations)
+
+
+def gpx_point_arrays(gpx: gpxpy.gpx.GPX) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extracts the coordinates of all track points of a parsed GPX file.
+
+    Counterpart of `read_gpx_points_fast` for callers that already hold a
+    gpxpy object. The values are collected in one pass into packed
+    ``array.array`` buffers, without intermediate lists.
+
+    Args:
+        gpx: Parsed GPX object.
+
+    Returns:
+        Tuple of (lats, lons, elevations) as float64 arrays in file order, with
+        NaN for missing elevations.
+    """
+    lats = array("d")
+    lons = array("d")
+    elevations = array("d")
+    for track in gpx.tracks:
+        for segment in track.segments:
+            for point in segment.points:
+                lats.append(point.latitude)
+                lons.append(point.longitude)
+                elevations.append(math.nan if point.elevation is None else point.elevation)
+    return np.frombuffer(lats), np.frombuffer(lons), np.frombuffer(elevations)
+
+
+def write_gpx_track(gpx_file: Path, points: Iterable[gpxpy.gpx.GPXTrackPoint]) -> int:
+    """Writes track points as a single-track GPX 1.1 file.
+
+    Streams one ``<trkpt>`` element per point straight into the file instead of
+    building a gpxpy object tree and serializing it with ``to_xml()``, so the
+    output never has to be held in memory as a whole. Only coordinates,
+    elevation and time are written.
 
+    Args:
+        gpx_file: Path of the GPX file to write.
+        points: Track points in output order.
+
+    Returns:
+        Number of written track points.
+    """
+    count = 0
+    with open(gpx_file, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(f'<gpx xmlns="{GPX_NAMESPACE}" version="1.1" creator="biketour_planner">\n  <trk>\n    <trkseg>\n')
+        for p in points:
+            f.write(f'      <trkpt lat="{p.latitude}" lon="{p.longitude}">')
+            if p.elevation is not None:
+                f.write(f"<ele>{p.elevation}</ele>")
+            if p.time is not None:
+                f.write(f"<time>{format_time(p.time)}</time>")
+            f.write("</trkpt>\n")
+            count += 1
+        f.write("    </trkseg>\n  </trk>\n</gpx>\n")
+    return count
+
+
+@lru_cache(maxsize=4096)
 def get_base_filename(filename: str) -> str:
     """Extracts the base filename without direction suffixes.
 
     Removes suffixes like '_inverted', '_reversed', '_rev' etc. to prevent
-    using the same track multiple times in different directions.
+    using the same track multiple times in different directions. Results are
+    memoized, since the same few filenames are looked up on every iteration
+    of the route search.
 
     Args:
         filename: GPX filename with potential direction suffix.
@@ -116,34 +437,416 @@ def get_base_filename(filename: str) -> str:
         'route_Munich_Garmisch.gpx'
     """
     # Remove common suffixes for inverted tracks
-    for suffix in ["_inverted", "_reversed", "_rev", "_inverse", "_backward"]:
-        if filename.lower().endswith(f"{suffix}.gpx"):
-            return filename[: -len(suffix) - 4] + ".gpx"
+    return _DIRECTION_SUFFIX_RE.sub(".gpx", filename, count=1)
+
+
+def get_track_points(gpx: gpxpy.gpx.GPX, start_index: int = 0, end_index: int | None = None) -> list[gpxpy.gpx.GPXTrackPoint]:
+    """Returns all points between two global point indices of a GPX object.
+
+    Global indices count points across all tracks and segments, as stored in
+    the GPX index. The start segment and offset are resolved via the prefix
+    sums of the segment sizes, so only the requested window is visited.
+
+    Args:
+        gpx: GPX object.
+        start_index: Global index of the first point (inclusive).
+        end_index: Global index of the last point (inclusive). None selects
+            all points up to the end of the file.
+
+    Returns:
+        List of GPXTrackPoint objects in file order.
+
+    Example:
+        >>> points = get_track_points(gpx, 10, 20)
+        >>> len(points)
+        11
+    """
+    segments = [seg.points for track in gpx.tracks for seg in track.segments]
+    return _select_window(segments, start_index, end_index)
 
-    return filename
 
+def _select_window(
+    segments: list[list[gpxpy.gpx.GPXTrackPoint]], start_index: int, end_index: int | None, reverse_segments: bool = False
+) -> list[gpxpy.gpx.GPXTrackPoint]:
+    """Selects the points between two global indices from a list of segments.
 
-def find_closest_point_in_track(points: list[dict], target_lat: float, target_lon: float) -> tuple[int, float]:
+    The first segment is located via the prefix sums of the segment sizes and
+    the loop stops after the last segment of the window, so only the window
+    itself is visited.
+
+    Args:
+        segments: Point lists of all segments in file order.
+        start_index: Global index of the first point (inclusive).
+        end_index: Global index of the last point (inclusive), None for all
+            points up to the end.
+        reverse_segments: If True, every segment is traversed backward and
+            the indices count along that traversal.
+
+    Returns:
+        List of the selected points in traversal order.
+    """
+    offsets = [0, *accumulate(len(points) for points in segments)]
+
+    if end_index is None:
+        end_index = offsets[-1] - 1
+    start_index = max(start_index, 0)
+    end_index = min(end_index, offsets[-1] - 1)
+    if start_index > end_index:
+        return []
+
+    result = []
+    seg_idx = bisect_right(offsets, start_index) - 1
+    while seg_idx < len(segments) and offsets[seg_idx] <= end_index:
+        points = segments[seg_idx]
+        local_start = max(start_index - offsets[seg_idx], 0)
+        local_end = min(end_index - offsets[seg_idx] + 1, len(points))
+        if reverse_segments:
+            result.extend(reversed(points[len(points) - local_end : len(points) - local_start]))
+        else:
+            result.extend(points[local_start:local_end])
+        seg_idx += 1
+
+    return result
+
+
+def find_closest_point_in_track(points: np.ndarray | list[dict], target_lat: float, target_lon: float) -> tuple[int, float]:
     """Finds the closest point within a track to a target coordinate.
 
+    The distances to all points are computed in one vectorized pass, and the
+    first point with the smallest distance wins.
+
     Args:
-        points: List of point dictionaries with keys 'lat', 'lon', 'index'.
+        points: Point array as created by `to_point_records`, or a list of
+            point dictionaries with keys 'lat', 'lon', 'index'.
         target_lat: Target latitude.
         target_lon: Target longitude.
 
     Returns:
         A tuple of (index, distance) for the closest point.
     """
-    best_idx = None
-    best_dist = float("inf")
+    if len(points) == 0:
+        return None, float("inf")
+
+    if isinstance(points, np.ndarray):
+        lats, lons = points["lat"], points["lon"]
+    else:
+        lats = np.fromiter((point["lat"] for point in points), dtype=np.float64, count=len(points))
+        lons = np.fromiter((point["lon"] for point in points), dtype=np.float64, count=len(points))
+
+    a = _haversine_term(target_lat, target_lon, lats, lons)
+    best = int(np.argmin(a))
+    return int(points[best]["index"]), haversine_term_to_m(float(a[best]))
+
+
+def find_closest_point_in_records(
+    points: np.ndarray, target_lat: float, target_lon: float, max_distance_m: float | None = None
+) -> tuple[int | None, float]:
+    """Finds the closest point of a flat point array to a target coordinate.
+
+    The candidate is chosen on the squared equirectangular distance, which
+    needs no trigonometry per point and is accurate to well below 0.1% over
+    the distances relevant for connecting tracks. Only the winning point is
+    measured with the exact Haversine formula.
+
+    Args:
+        points: Point array with the fields 'lat' and 'lon', as created by
+            `to_point_records`. The position in the array is the point index.
+        target_lat: Target latitude.
+        target_lon: Target longitude.
+        max_distance_m: Optional distance limit. If the approximate distance
+            of the closest point clearly exceeds it, the approximation is
+            returned as is and the exact Haversine distance is skipped.
+
+    Returns:
+        A tuple of (index, distance) for the closest point, or (None, inf)
+        for an empty array.
+    """
+    if len(points) == 0:
+        return None, float("inf")
+
+    cos_t = math.cos(math.radians(target_lat))
+    dy = points["lat"] - target_lat
+    dx = (points["lon"] - target_lon) * cos_t
+    d2 = dy * dy + dx * dx
+    best = int(np.argmin(d2))
+
+    if max_distance_m is not None:
+        approx_m = math.radians(math.sqrt(float(d2[best]))) * EARTH_RADIUS_M
+        if approx_m > EQUIRECTANGULAR_MARGIN * max_distance_m:
+            return best, approx_m
+
+    return best, haversine(target_lat, target_lon, float(points["lat"][best]), float(points["lon"][best]))
+
+
+def build_point_strip(tracks: Sequence[np.ndarray]) -> PointStrip:
+    """Merges the point arrays of many tracks into one grid-sorted index.
+
+    Every point keeps the position of its track in `tracks` (owner) and its
+    index within the track. The points are grouped into latitude rows of
+    `POINT_GRID_ROW_DEG` and sorted by longitude within each row, so
+    `find_closest_point_per_track` only visits the cells around a query,
+    found by binary searches, instead of every point.
+
+    Args:
+        tracks: Point arrays with the fields 'lat' and 'lon', as created by
+            `make_point_records`.
+
+    Returns:
+        Tuple of (lats, lons, owners, indices, row_ids, row_starts). The first
+        four are sorted by row and longitude; `row_ids` holds the distinct rows
+        in ascending order and `row_starts` the position of their first point.
+    """
+    if not tracks:
+        empty = np.empty(0, dtype=np.float64)
+        no_ints = np.empty(0, dtype=np.int64)
+        return empty, empty, no_ints, no_ints, no_ints, no_ints
+
+    lats = np.concatenate([points["lat"] for points in tracks])
+    lons = np.concatenate([points["lon"] for points in tracks])
+    owners = np.repeat(np.arange(len(tracks)), [len(points) for points in tracks])
+    indices = np.concatenate([np.arange(len(points)) for points in tracks])
+
+    rows = np.floor(lats / POINT_GRID_ROW_DEG).astype(np.int64)
+    order = np.lexsort((lons, rows))
+    row_ids, row_starts = np.unique(rows[order], return_index=True)
+    return lats[order], lons[order], owners[order], indices[order], row_ids, row_starts
+
+
+def find_closest_point_per_track(
+    strip: PointStrip, target_lat: float, target_lon: float, max_distance_m: float
+) -> list[tuple[int, int, float]]:
+    """Finds the closest point of every track that may lie within a distance.
+
+    Gives the same result as calling `find_closest_point_in_records` with
+    `max_distance_m` for each track and dropping the tracks whose closest
+    point was rejected on the approximate distance. Only the points in the
+    grid cells around the target are visited.
+
+    Args:
+        strip: Point index as created by `build_point_strip`.
+        target_lat: Target latitude.
+        target_lon: Target longitude.
+        max_distance_m: Distance limit in meters.
+
+    Returns:
+        List of (owner, index, distance) per track, ordered by owner. The
+        distance is exact and may still slightly exceed `max_distance_m`.
+    """
+    lats, lons, owners, indices, row_ids, row_starts = strip
+    # A little wider than the rejection limit, so rounding never drops a candidate
+    dlat = math.degrees(max_distance_m * EQUIRECTANGULAR_MARGIN / EARTH_RADIUS_M) * 1.01
+    cos_t = math.cos(math.radians(target_lat))
+    # Longitude differences are scaled by cos_t, so the window widens by 1 / cos_t
+    dlon = dlat / cos_t if cos_t > 1e-9 else math.inf
+
+    first_row = int(np.searchsorted(row_ids, math.floor((target_lat - dlat) / POINT_GRID_ROW_DEG), side="left"))
+    last_row = int(np.searchsorted(row_ids, math.floor((target_lat + dlat) / POINT_GRID_ROW_DEG), side="right"))
+    slices = []
+    for row in range(first_row, last_row):
+        row_start = int(row_starts[row])
+        row_end = int(row_starts[row + 1]) if row + 1 < len(row_starts) else len(lons)
+        row_lons = lons[row_start:row_end]
+        lo = row_start + int(np.searchsorted(row_lons, target_lon - dlon, side="left"))
+        hi = row_start + int(np.searchsorted(row_lons, target_lon + dlon, side="right"))
+        if lo < hi:
+            slices.append(np.arange(lo, hi))
+    if not slices:
+        return []
+
+    cell = np.concatenate(slices)
+    cell_lats, cell_lons, cell_owners, cell_indices = lats[cell], lons[cell], owners[cell], indices[cell]
+    dy = cell_lats - target_lat
+    dx = (cell_lons - target_lon) * cos_t
+    d2 = dy * dy + dx * dx
+
+    # Per owner the smallest distance, and on ties the smallest index like np.argmin
+    order = np.lexsort((cell_indices, d2, cell_owners))
+    sorted_owners = cell_owners[order]
+    first = order[np.concatenate(([True], sorted_owners[1:] != sorted_owners[:-1]))]
+
+    result = []
+    for k in first:
+        approx_m = math.radians(math.sqrt(float(d2[k]))) * EARTH_RADIUS_M
+        if approx_m > EQUIRECTANGULAR_MARGIN * max_distance_m:
+            continue
+        distance = haversine(target_lat, target_lon, float(cell_lats[k]), float(cell_lons[k]))
+        result.append((int(cell_owners[k]), int(cell_indices[k]), distance))
+    return result
+
+
+def to_point_records(points: Sequence[gpxpy.gpx.GPXTrackPoint]) -> np.ndarray:
+    """Converts GPX track points into a structured point array.
+
+    Args:
+        points: Track points in file order.
+
+    Returns:
+        Structured array of `POINT_DTYPE`, see `make_point_records`.
+    """
+    return make_point_records(
+        [p.latitude for p in points],
+        [p.longitude for p in points],
+        [np.nan if p.elevation is None else p.elevation for p in points],
+    )
+
+
+def make_point_records(lats: Sequence[float], lons: Sequence[float], elevations: Sequence[float]) -> np.ndarray:
+    """Builds a structured point array from coordinate sequences.
+
+    Args:
+        lats: Latitudes in file order.
+        lons: Longitudes in file order.
+        elevations: Elevations in file order, NaN for missing values.
+
+    Returns:
+        Structured array of `POINT_DTYPE` with the fields 'lat', 'lon',
+        'elevation' and 'index'. Coordinates are kept as float64, since
+        float32 would shift points by up to half a meter and bias the summed
+        distances. Elevations are stored as float32, which is exact to well
+        below a millimeter and far finer than GPS elevation data.
+    """
+    records = np.empty(len(lats), dtype=POINT_DTYPE)
+    records["lat"] = lats
+    records["lon"] = lons
+    records["elevation"] = elevations
+    records["index"] = np.arange(len(lats))
+    return records
+
+
+def get_bounding_box(points: np.ndarray) -> BoundingBox:
+    """Returns the bounding box of a point array.
+
+    Args:
+        points: Non-empty point array with the fields 'lat' and 'lon'.
+
+    Returns:
+        Tuple of (min_lat, min_lon, max_lat, max_lon) in decimal degrees.
+    """
+    return (
+        float(points["lat"].min()),
+        float(points["lon"].min()),
+        float(points["lat"].max()),
+        float(points["lon"].max()),
+    )
+
+
+def is_near_bounding_box(bbox: BoundingBox, lat: float, lon: float, radius_m: float) -> bool:
+    """Checks whether a bounding box may contain points within a radius.
+
+    The test is conservative: it never rejects a box that has a point within
+    `radius_m`, but may accept boxes whose points are all further away. It
+    lets track searches skip files far away from the query position before
+    any per-point distance is computed.
+
+    Args:
+        bbox: Tuple of (min_lat, min_lon, max_lat, max_lon) in decimal degrees.
+        lat: Latitude of the query position.
+        lon: Longitude of the query position.
+        radius_m: Search radius in meters.
+
+    Returns:
+        False if no point of the box can be within the radius, True otherwise.
+    """
+    min_lat, min_lon, max_lat, max_lon = bbox
+    dlat, dlon = _bounding_box_margins(lat, radius_m)
+    if lat < min_lat - dlat or lat > max_lat + dlat:
+        return False
+    return min_lon - dlon <= lon <= max_lon + dlon
+
+
+def are_near_bounding_boxes(bboxes: np.ndarray, lat: float, lon: float, radius_m: float) -> np.ndarray:
+    """Vectorized `is_near_bounding_box` over many bounding boxes.
 
-    for point in points:
-        d = haversine(target_lat, target_lon, point["lat"], point["lon"])
-        if d < best_dist:
-            best_dist = d
-            best_idx = point["index"]
+    Args:
+        bboxes: Array of shape (N, 4) with one (min_lat, min_lon, max_lat,
+            max_lon) row per box.
+        lat: Latitude of the query position.
+        lon: Longitude of the query position.
+        radius_m: Search radius in meters.
+
+    Returns:
+        Boolean array with the result of `is_near_bounding_box` for each box.
+    """
+    dlat, dlon = _bounding_box_margins(lat, radius_m)
+    return (
+        (bboxes[:, 0] - dlat <= lat)
+        & (lat <= bboxes[:, 2] + dlat)
+        & (bboxes[:, 1] - dlon <= lon)
+        & (lon <= bboxes[:, 3] + dlon)
+    )
 
-    return best_idx, best_dist
+
+def _bounding_box_margins(lat: float, radius_m: float) -> tuple[float, float]:
+    """Returns the latitude and longitude margins in degrees for a search radius."""
+    dlat = math.degrees(radius_m * EQUIRECTANGULAR_MARGIN / EARTH_RADIUS_M)
+    # Longitude degrees shrink towards the poles, so widen with the most poleward latitude
+    poleward_lat = min(abs(lat) + dlat, 89.0)
+    return dlat, dlat / math.cos(math.radians(poleward_lat))
+
+
+def bounding_box_min_distance(bbox: BoundingBox, lat: float, lon: float) -> float:
+    """Returns a lower bound for the distance from a position to a bounding box.
+
+    No point inside the box is closer to the position than the returned
+    Haversine distance. The bound uses the latitude and longitude gaps to the
+    box and the most poleward latitude involved, so it can be used to skip
+    boxes that cannot beat a distance already found.
+
+    Args:
+        bbox: Tuple of (min_lat, min_lon, max_lat, max_lon) in decimal degrees.
+        lat: Latitude of the query position.
+        lon: Longitude of the query position.
+
+    Returns:
+        Lower bound of the distance in meters, 0.0 if the position lies
+        inside the box.
+    """
+    min_lat, min_lon, max_lat, max_lon = bbox
+    dlat = max(min_lat - lat, lat - max_lat, 0.0)
+    dlon = max(min_lon - lon, lon - max_lon, 0.0)
+    if dlat == 0.0 and dlon == 0.0:
+        return 0.0
+
+    cos_poleward = math.cos(math.radians(max(abs(lat), abs(min_lat), abs(max_lat))))
+    a = math.sin(math.radians(dlat) / 2) ** 2 + (cos_poleward * math.sin(math.radians(min(dlon, 180.0)) / 2)) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(math.sqrt(a), 1.0))
+
+
+def get_statistics4points(
+    points: np.ndarray,
+    max_elevation: float = 0.0,
+    total_distance: float = 0.0,
+    total_ascent: float = 0.0,
+    total_descent: float = 0.0,
+) -> TrackStats:
+    """Calculates statistics for a flat point array in traversal order.
+
+    Args:
+        points: Point array with the fields 'lat', 'lon' and 'elevation' (NaN
+            for missing elevations), already ordered in the direction of travel.
+        max_elevation: Previous max elevation.
+        total_distance: Previous total distance.
+        total_ascent: Previous total ascent.
+        total_descent: Previous total descent.
+
+    Returns:
+        Tuple of (max_elevation, total_distance, total_ascent, total_descent).
+    """
+    if len(points) > 1:
+        lats, lons = points["lat"], points["lon"]
+        total_distance += float(haversine_vec(lats[:-1], lons[:-1], lats[1:], lons[1:]).sum())
+
+    ele = points["elevation"]
+    elevations = ele[~np.isnan(ele)]
+    if elevations.size:
+        max_elevation = max(float(elevations.max()), max_elevation)
+
+        # take mean of elevation calculations as both are not accurate
+        ascent, descent = calculate_elevation_gain_loss(elevations)
+        total_ascent += ascent
+        total_descent += descent
+
+    return max_elevation, total_distance, total_ascent, total_descent
 
 
 def get_statistics4track(
@@ -172,48 +875,45 @@ def get_statistics4track(
         Tuple of (max_elevation, total_distance, total_ascent, total_descent).
     """
     if not end_index or end_index == float("inf"):
-        # Determine total number of points
-        num_points = 0
-        for track in gpx.tracks:
-            for seg in track.segments:
-                num_points += len(seg.points)
-        end_index = num_points - 1
-
-    segment_points = []
-    point_counter = 0
-    for track in gpx.tracks:
-        for seg in track.segments:
-            if reversed_direction:
-                for p in seg.points[::-1]:
-                    if start_index <= point_counter <= end_index:
-                        segment_points.append(p)
-                    point_counter += 1
-            else:
-                for p in seg.points:
-                    if start_index <= point_counter <= end_index:
-                        segment_points.append(p)
-                    point_counter += 1
-
-    prev = None
-    for p in segment_points:
-        if prev:
-            d = haversine(prev.latitude, prev.longitude, p.latitude, p.longitude)
-            total_distance += d
-        prev = p
-
-    elevations = [p.elevation for p in segment_points if p.elevation is not None]
-    if elevations:
-        max_elevation = max(max(elevations), max_elevation)
+        end_index = None
 
-        # take mean of elevation calculations as both are not accurate
-        ascent_segment = calculate_elevation_gain_segment_based(elevations, calculate_descent=False)
-        ascent_smoothed = calculate_elevation_gain_smoothed(elevations, calculate_descent=False)
-        total_ascent += (ascent_segment + ascent_smoothed) / 2
+    segments = [seg.points for track in gpx.tracks for seg in track.segments]
+    segment_points = _select_window(segments, start_index, end_index, reverse_segments=reversed_direction)
 
-        descent_segment = calculate_elevation_gain_segment_based(elevations, calculate_descent=True)
-        descent_smoothed = calculate_elevation_gain_smoothed(elevations, calculate_descent=True)
-        total_descent += (descent_segment + descent_smoothed) / 2
+    # One pass over the point objects; the statistics then run on the arrays
+    points = np.fromiter(
+        ((p.latitude, p.longitude, np.nan if p.elevation is None else p.elevation) for p in segment_points),
+        dtype=_STATS_DTYPE,
+        count=len(segment_points),
+    )
+    max_elevation, total_distance, total_ascent, total_descent = get_statistics4points(
+        points, max_elevation, total_distance, total_ascent, total_descent
+    )
 
     logger.debug(f"   Points: {len(segment_points)}")
 
     return max_elevation, total_distance, total_ascent, total_descent
+
+
+def get_statistics4file(gpx_file: Path) -> TrackStats | None:
+    """Calculates statistics for all track points of a GPX file.
+
+    Reads the coordinates with `read_gpx_points_fast` into flat arrays, so no
+    gpxpy point objects are created. Falls back to `read_gpx_file` and
+    `get_statistics4track` if the fast reader fails or finds no points.
+
+    Args:
+        gpx_file: Path to the GPX file.
+
+    Returns:
+        Tuple of (max_elevation, total_distance, total_ascent, total_descent),
+        or None if the file cannot be read or contains no tracks.
+    """
+    track = read_gpx_points_fast(gpx_file)
+    if track is not None and len(track[0]):
+        return get_statistics4points(np.rec.fromarrays(track, names="lat,lon,elevation"))
+
+    gpx = read_gpx_file(gpx_file)
+    if gpx is None or not gpx.tracks:
+        return None
+    return get_statistics4track(gpx)
@@ -74,6 +74,8 @@ class RouteContext:
         used_base_files: Set of base filenames already used.
         route_files: List of GPX segments forming the route.
         force_direction: Direction to force for the first segment ('forward' or 'backward').
+        surface_segments: Start/end coordinates (lat, lon, lat, lon) of all traversed track
+            sections whose surface statistics still have to be fetched from BRouter.
     """
 
     iteration: int
@@ -82,6 +84,7 @@ class RouteContext:
     used_base_files: set[str] = field(default_factory=set)
     route_files: list[dict[str, Any]] = field(default_factory=list)
     force_direction: str | None = None
+    surface_segments: list[tuple[float, float, float, float]] = field(default_factory=list)
 
 
 class Booking(BaseModel):
@@ -5,12 +5,19 @@ sie den nächstgelegenen Hotels zu.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .config import get_config
 from .geocode import geocode_address
-from .gpx_route_manager_static import get_statistics4track, haversine, read_gpx_file
+from .gpx_route_manager_static import (
+    get_statistics4file,
+    haversine,
+    read_gpx_file,
+    read_gpx_points_fast,
+    scan_gpx_files,
+)
 from .logger import get_logger
 
 logger = get_logger()
@@ -58,6 +65,14 @@ def get_gpx_endpoints(gpx_file: Path) -> tuple[float, float, float, float] | Non
     Returns:
         Tuple (start_lat, start_lon, end_lat, end_lon) oder None bei Fehler.
     """
+    track = read_gpx_points_fast(gpx_file)
+    if track is not None:
+        lats, lons, _ = track
+        if lats.size == 0:
+            return None
+        return float(lats[0]), float(lons[0]), float(lats[-1]), float(lons[-1])
+
+    # Fallback auf gpxpy mit Encoding-Behandlung
     gpx = read_gpx_file(gpx_file)
 
     if gpx is None or not gpx.tracks:
@@ -84,6 +99,17 @@ def get_gpx_endpoints(gpx_file: Path) -> tuple[float, float, float, float] | Non
     )
 
 
+@lru_cache(maxsize=512)
+def _get_gpx_endpoints_cached(gpx_file: Path, size: int, mtime_ns: int) -> tuple[float, float, float, float] | None:
+    """Wie `get_gpx_endpoints`, merkt sich das Ergebnis aber pro Dateistand.
+
+    `find_pass_track` durchsucht für jeden Pass alle GPX-Dateien. Durch den
+    Cache wird jede Datei nur einmal gelesen; Größe und Änderungszeit im
+    Schlüssel sorgen dafür, dass geänderte Dateien neu gelesen werden.
+    """
+    return get_gpx_endpoints(gpx_file)
+
+
 def find_nearest_hotel(pass_lat: float, pass_lon: float, bookings: list[dict]) -> dict | None:
     """Findet das nächstgelegene Hotel zu einem Pass.
 
@@ -159,8 +185,8 @@ def find_pass_track(
     best_track = None
     best_score = float("inf")  # Geringste Summe der Abstände
 
-    for gpx_file in gpx_dir.glob("*.gpx"):
-        endpoints = get_gpx_endpoints(gpx_file)
+    for gpx_file, size, mtime_ns in scan_gpx_files(gpx_dir):
+        endpoints = _get_gpx_endpoints_cached(gpx_file, size, mtime_ns)
 
         if endpoints is None:
             continue
@@ -301,10 +327,10 @@ def process_passes(
 
         if track_file:
             # Berechne Statistiken für Pass-Track
-            gpx = read_gpx_file(track_file)
+            track_stats = get_statistics4file(track_file)
 
-            if gpx and gpx.tracks:
-                max_elevation, total_distance, total_ascent, total_descent = get_statistics4track(gpx)
+            if track_stats is not None:
+                max_elevation, total_distance, total_ascent, total_descent = track_stats
 
                 # Füge Track zum Buchungs-Dictionary hinzu mit Statistiken
                 pass_track_entry = {
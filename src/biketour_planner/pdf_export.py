@@ -25,7 +25,7 @@ from .elevation_profiles import (
 )
 from .excel_export import create_accommodation_text, extract_city_name
 from .excel_info_reader import read_daily_info_from_excel
-from .gpx_route_manager_static import get_statistics4track, read_gpx_file
+from .gpx_route_manager_static import get_statistics4file
 
 
 def create_tourist_sights_links(tourist_sights: dict | None) -> list[str]:
@@ -283,9 +283,9 @@ def export_bookings_to_pdf(
             gpx_tracks.append(f"{pass_file}<br/>({pass_track.get('passname', '')})")
             pass_gpx_path = gpx_dir / pass_track.get("file", "") if gpx_dir else None
             if pass_gpx_path and pass_gpx_path.exists():
-                gpx = read_gpx_file(pass_gpx_path)
-                if gpx and gpx.tracks:
-                    p_max, p_dist, p_asc, _ = get_statistics4track(gpx)
+                pass_stats = get_statistics4file(pass_gpx_path)
+                if pass_stats is not None:
+                    p_max, p_dist, p_asc, _ = pass_stats
                     pass_km = p_dist / 1000
                     km_values.append(f"{pass_km:.0f}")
                     total_km += pass_km
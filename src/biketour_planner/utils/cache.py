@@ -2,11 +2,19 @@
 Caching utilities for the bike tour planner.
 """
 
+import contextlib
 import functools
 import json
+import os
+import pickle
+import tempfile
 from collections.abc import Callable
 from pathlib import Path
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
+
+from ..logger import get_logger
+
+logger = get_logger()
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -30,6 +38,64 @@ def load_json_cache(path: Path) -> dict:
     return {}
 
 
+def load_pickle_cache(path: Path) -> Any | None:
+    """Load a pickled cache file from the given path.
+
+    Any failure while reading or unpickling is treated as a cache miss, so
+    callers simply rebuild the cached data.
+
+    Warning:
+        Unpickling can execute arbitrary code. Only load caches from locations
+        that are as trusted as the code itself, such as the cache directory
+        this application writes into the user's own data directories.
+
+    Args:
+        path: Path to the pickle file.
+
+    Returns:
+        The unpickled object, or None if the file is missing or unreadable.
+    """
+    if path.exists():
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.debug("Ignoring unreadable pickle cache %s: %s", path, e)
+    return None
+
+
+def save_pickle_cache(path: Path, data: Any) -> bool:
+    """Pickle an object to the given path.
+
+    The data is written to a uniquely named temporary file in the same
+    directory first and then moved into place, so concurrent readers never
+    see a partially written cache, and concurrent writers never share a
+    temporary file.
+
+    Args:
+        path: Target path of the pickle file.
+        data: Object to store.
+
+    Returns:
+        True if the cache was written, False otherwise.
+    """
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as f:
+            tmp_path = Path(f.name)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError):
+        return False
+    finally:
+        # No-op after a successful replace; removes the leftover file otherwise
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+    return True
+
+
 def json_cache(
     cache_file: Path, cache_dict_name: str | None = None, cache_file_var_name: str | None = None
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
@@ -8,6 +8,9 @@ Testet die BRouter API Integration inklusive:
 """
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
 import gpxpy
@@ -15,6 +18,7 @@ import pytest
 import requests
 
 from biketour_planner.brouter import (
+    _get_session,
     check_brouter_availability,
     get_route2address_as_points,
     get_route2address_with_stats,
@@ -27,7 +31,7 @@ from biketour_planner.exceptions import RoutingError
 class TestCheckBRouterAvailability:
     """Tests für die check_brouter_availability Funktion."""
 
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_check_availability_success(self, mock_get):
         """Testet Verfügbarkeit bei Status 200."""
         mock_response = Mock()
@@ -39,7 +43,7 @@ class TestCheckBRouterAvailability:
         assert "timeout" in mock_get.call_args[1]
         assert mock_get.call_args[1]["timeout"] == 5
 
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_check_availability_400(self, mock_get):
         """Testet Verfügbarkeit bei Status 400 (Bad Request)."""
         # BRouter liefert oft 400 zurück, wenn keine Parameter übergeben werden
@@ -49,7 +53,7 @@ class TestCheckBRouterAvailability:
 
         assert check_brouter_availability() is True
 
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_check_availability_500(self, mock_get):
         """Testet Nicht-Verfügbarkeit bei Server-Fehler (500)."""
         mock_response = Mock()
@@ -58,7 +62,7 @@ class TestCheckBRouterAvailability:
 
         assert check_brouter_availability() is False
 
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_check_availability_connection_error(self, mock_get):
         """Testet Nicht-Verfügbarkeit bei Verbindungsfehler."""
         mock_get.side_effect = requests.exceptions.ConnectionError()
@@ -70,7 +74,7 @@ class TestRouteToAddress:
     """Tests für die route_to_address Funktion."""
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_success(self, mock_get, mock_check):
         """Testet erfolgreiche Routenberechnung."""
         # Mock BRouter als verfügbar
@@ -115,7 +119,7 @@ class TestRouteToAddress:
         assert call_args[1]["params"]["format"] == "gpx"
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_coordinate_order(self, mock_get, mock_check):
         """Testet korrekte Koordinatenreihenfolge (lon,lat)."""
         # Mock BRouter als verfügbar
@@ -134,7 +138,7 @@ class TestRouteToAddress:
         assert lonlats == "13.405,52.52|13.0645,52.3906"
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_negative_coordinates(self, mock_get, mock_check):
         """Testet Routing mit negativen Koordinaten."""
         # Mock BRouter als verfügbar
@@ -153,7 +157,7 @@ class TestRouteToAddress:
         assert "151,-34" in lonlats
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_http_error_404(self, mock_get, mock_check):
         """Testet Verhalten bei HTTP 404 (Server nicht erreichbar)."""
         # Mock BRouter als verfügbar
@@ -167,7 +171,7 @@ class TestRouteToAddress:
             route_to_address(48.1351, 11.5820, 47.4917, 11.0953)
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_http_error_400(self, mock_get, mock_check):
         """Testet Verhalten bei HTTP 400 (fehlende Routing-Daten)."""
         # Mock BRouter als verfügbar
@@ -181,7 +185,7 @@ class TestRouteToAddress:
             route_to_address(48.1351, 11.5820, 47.4917, 11.0953)
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_connection_error(self, mock_get, mock_check):
         """Testet Verhalten bei Verbindungsfehler."""
         # Mock BRouter als verfügbar (aber dann schlägt die Verbindung fehl)
@@ -193,7 +197,7 @@ class TestRouteToAddress:
             route_to_address(48.1351, 11.5820, 47.4917, 11.0953)
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_timeout(self, mock_get, mock_check):
         """Testet Verhalten bei Timeout."""
         # Mock BRouter als verfügbar
@@ -205,7 +209,7 @@ class TestRouteToAddress:
             route_to_address(48.1351, 11.5820, 47.4917, 11.0953)
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_empty_response(self, mock_get, mock_check):
         """Testet Verhalten bei leerer Response."""
         # Mock BRouter als verfügbar
@@ -221,7 +225,7 @@ class TestRouteToAddress:
         assert result == ""
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_uses_trekking_profile(self, mock_get, mock_check):
         """Testet dass das 'trekking' Profil verwendet wird."""
         # Mock BRouter als verfügbar
@@ -237,7 +241,7 @@ class TestRouteToAddress:
         assert call_args[1]["params"]["profile"] == "trekking"
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_gpx_format(self, mock_get, mock_check):
         """Testet dass GPX-Format angefordert wird."""
         # Mock BRouter als verfügbar
@@ -253,7 +257,7 @@ class TestRouteToAddress:
         assert call_args[1]["params"]["format"] == "gpx"
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_same_start_end(self, mock_get, mock_check):
         """Testet Routing mit identischen Start- und Endkoordinaten."""
         # Mock BRouter als verfügbar
@@ -268,7 +272,7 @@ class TestRouteToAddress:
         assert "<gpx>" in result
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_route_to_address_high_precision_coordinates(self, mock_get, mock_check):
         """Testet Routing mit hochpräzisen Koordinaten."""
         # Mock BRouter als verfügbar
@@ -422,7 +426,7 @@ class TestBRouterGeoJSON:
     """Tests für GeoJSON-spezifische BRouter-Funktionen."""
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_get_route2address_with_stats_success(self, mock_get, mock_check):
         """Testet erfolgreiche GeoJSON-Routenanforderung."""
         mock_check.return_value = True
@@ -487,7 +491,7 @@ class TestBRouterIntegration:
     """Integrationstests für die BRouter-Module."""
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_full_workflow(self, mock_get, mock_check):
         """Testet kompletten Workflow: Route anfordern + Punkte extrahieren."""
         mock_check.return_value = True
@@ -514,7 +518,7 @@ class TestBRouterIntegration:
         assert points[-1].latitude == 47.4917
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_workflow_server_down(self, mock_get, mock_check):
         """Testet Workflow wenn BRouter-Server nicht erreichbar ist."""
         # Mock BRouter als verfügbar (damit check_brouter_availability() nicht abbricht)
@@ -532,7 +536,7 @@ class TestBRouterIntegration:
             get_route2address_as_points(48.1351, 11.5820, 47.4917, 11.0953)
 
     @patch("biketour_planner.brouter.check_brouter_availability")
-    @patch("biketour_planner.brouter.requests.get")
+    @patch("biketour_planner.brouter.requests.Session.get")
     def test_workflow_coordinates_validation(self, mock_get, mock_check):
         """Testet dass Koordinaten korrekt durch beide Funktionen gehen."""
         # Mock BRouter als verfügbar
@@ -567,5 +571,74 @@ class TestBRouterIntegration:
             assert expected_end in lonlats
 
 
+class TestBRouterSessions:
+    """Tests für die threadlokalen HTTP-Sessions."""
+
+    def test_session_is_reused_within_thread(self):
+        """Testet dass ein Thread bei wiederholten Aufrufen dieselbe Session erhält."""
+        assert _get_session() is _get_session()
+
+    def test_each_thread_gets_own_session(self):
+        """Testet dass parallele Threads nie dieselbe Session teilen."""
+        workers = 4
+        barrier = threading.Barrier(workers)
+
+        def session_of_thread(_):
+            # Alle Threads gleichzeitig halten, damit kein Worker zwei Aufgaben übernimmt
+            barrier.wait(timeout=5)
+            return _get_session()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sessions = list(executor.map(session_of_thread, range(workers)))
+
+        assert len({id(session) for session in sessions}) == workers
+        assert _get_session() not in sessions
+
+    def test_parallel_requests_against_server(self):
+        """Testet parallele GeoJSON-Anfragen über echte Sessions gegen einen lokalen Server."""
+        geojson = json.dumps(
+            {
+                "features": [
+                    {
+                        "geometry": {"coordinates": [[11.58, 48.13, 500], [11.59, 48.14, 510]]},
+                        "properties": {
+                            "messages": [["Distance", "surface"], ["0", "asphalt"], ["1000", "gravel"]],
+                        },
+                    }
+                ]
+            }
+        ).encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(geojson)))
+                self.end_headers()
+                self.wfile.write(geojson)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            config = Mock()
+            config.routing.brouter_url = f"http://127.0.0.1:{server.server_address[1]}/"
+            with patch("biketour_planner.brouter.get_config", return_value=config):
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = list(executor.map(lambda i: get_route2address_with_stats(48.13, 11.58, 48.14, 11.59), range(32)))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        for points, stats in results:
+            assert len(points) == 2
+            assert stats == {"paved": 0.0, "unpaved": 1000.0, "other": 0.0}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -59,7 +59,7 @@ def complete_tour_setup(tmp_path, booking_html):
 
 
 @pytest.mark.integration
-@patch("biketour_planner.brouter.requests.get")
+@patch("biketour_planner.brouter.requests.Session.get")
 @patch("biketour_planner.geoapify.requests.get")
 def test_complete_planning_workflow(mock_geoapify, mock_brouter, complete_tour_setup, booking_html):
     """Test complete workflow: parse -> route -> merge."""
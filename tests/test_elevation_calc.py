@@ -1,4 +1,10 @@
+import numpy as np
+import pytest
+
 from biketour_planner.elevation_calc import (
+    calculate_elevation_gain_loss,
+    calculate_elevation_gain_loss_segment_based,
+    calculate_elevation_gain_loss_smoothed,
     calculate_elevation_gain_segment_based,
     calculate_elevation_gain_simple,
     calculate_elevation_gain_smoothed,
@@ -93,3 +99,40 @@ def test_calculate_elevation_gain_segment_based_short_track():
 def test_calculate_elevation_gain_segment_based_constant():
     elevations = [100] * 20
     assert calculate_elevation_gain_segment_based(elevations) == 0.0
+
+
+def test_calculate_elevation_gain_loss_matches_single_direction():
+    elevations = list(range(100, 200, 5)) + list(range(200, 180, -2)) + [181, 179, 183, 177] + list(range(180, 250, 3))
+
+    ascent, descent = calculate_elevation_gain_loss_segment_based(elevations)
+    assert ascent == pytest.approx(calculate_elevation_gain_segment_based(elevations))
+    assert descent == pytest.approx(calculate_elevation_gain_segment_based(elevations, calculate_descent=True))
+
+    gain, loss = calculate_elevation_gain_loss_smoothed(elevations)
+    assert gain == pytest.approx(calculate_elevation_gain_smoothed(elevations))
+    assert loss == pytest.approx(calculate_elevation_gain_smoothed(elevations, calculate_descent=True))
+
+
+def test_calculate_elevation_gain_loss_accepts_nan_array():
+    elevations = np.array([100.0, np.nan, 110.0, 120.0, np.nan, 100.0])
+    # Fehlende Werte werden ignoriert: 100 -> 110 -> 120 -> 100
+    assert calculate_elevation_gain_loss_segment_based(elevations) == (20.0, 20.0)
+    assert calculate_elevation_gain_loss_smoothed(elevations) == (20.0, 20.0)
+
+
+def test_calculate_elevation_gain_loss_edge_cases():
+    assert calculate_elevation_gain_loss_segment_based([]) == (0.0, 0.0)
+    assert calculate_elevation_gain_loss_smoothed([100]) == (0.0, 0.0)
+    assert calculate_elevation_gain_loss_segment_based([100] * 20) == (0.0, 0.0)
+
+
+def test_calculate_elevation_gain_loss_is_mean_of_methods():
+    elevations = [100 + (i % 17) * 2.5 - (i % 5) for i in range(60)]
+
+    ascent_segment, descent_segment = calculate_elevation_gain_loss_segment_based(elevations)
+    ascent_smoothed, descent_smoothed = calculate_elevation_gain_loss_smoothed(elevations)
+
+    ascent, descent = calculate_elevation_gain_loss(elevations)
+    assert ascent == pytest.approx((ascent_segment + ascent_smoothed) / 2)
+    assert descent == pytest.approx((descent_segment + descent_smoothed) / 2)
+    assert calculate_elevation_gain_loss([100]) == (0.0, 0.0)
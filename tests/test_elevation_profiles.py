@@ -177,6 +177,25 @@ class TestExtractElevationProfile:
         assert 500 in elevations
         assert 520 in elevations
 
+    def test_extract_profile_namespaced_gpx(self, tmp_path):
+        """Testet GPX 1.1 mit Namespace über mehrere Segmente."""
+        gpx_content = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk>
+    <trkseg><trkpt lat="48.0" lon="11.0"><ele>500</ele></trkpt></trkseg>
+    <trkseg><trkpt lat="48.01" lon="11.0"><ele>510.5</ele></trkpt></trkseg>
+  </trk>
+</gpx>"""
+
+        gpx_file = tmp_path / "namespaced.gpx"
+        gpx_file.write_text(gpx_content, encoding="utf-8")
+
+        distances, elevations = extract_elevation_profile(gpx_file)
+
+        assert elevations.tolist() == [500.0, 510.5]
+        assert distances[0] == 0.0
+        assert distances[1] == pytest.approx(1.112, abs=0.001)
+
 
 # ============================================================================
 # Test calculate_gradient
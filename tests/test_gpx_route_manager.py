@@ -13,9 +13,12 @@ Testet die GPXRouteManager-Klasse inklusive:
 from unittest.mock import patch
 
 import gpxpy
+import numpy as np
 import pytest
 
+from biketour_planner.constants import GPX_INDEX_CACHE_VERSION, GPX_INDEX_PARALLEL_MIN_FILES
 from biketour_planner.gpx_route_manager import GPXRouteManager
+from biketour_planner.gpx_route_manager_static import read_gpx_points_fast
 
 # ============================================================================
 # Test-Fixtures
@@ -231,6 +234,89 @@ class TestGPXIndexPreprocessing:
         assert points[2]["lat"] == 48.2
         assert points[2]["index"] == 2
 
+    def test_index_falls_back_to_gpxpy(self, gpx_dir, output_dir):
+        """Testet den Fallback auf gpxpy, wenn der schnelle Parser scheitert."""
+        # Leerzeichen vor der XML-Deklaration sind für lxml ein Syntaxfehler
+        gpx_content = """  <?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1"><trk><trkseg>
+<trkpt lat="48.0" lon="11.0"><ele>500</ele></trkpt>
+<trkpt lat="48.1" lon="11.1"><ele>520</ele></trkpt>
+</trkseg></trk></gpx>"""
+        (gpx_dir / "whitespace.gpx").write_text(gpx_content, encoding="utf-8")
+
+        manager = GPXRouteManager(gpx_dir, output_dir)
+
+        meta = manager.gpx_index["whitespace.gpx"]
+        assert len(meta["points"]) == 2
+        assert meta["max_elevation_m"] == 520
+
+    def test_index_is_loaded_from_cache(self, simple_gpx_file, output_dir):
+        """Testet dass ein unveränderter GPX-Ordner nicht erneut geparst wird."""
+        GPXRouteManager(simple_gpx_file.parent, output_dir)
+        assert list((simple_gpx_file.parent / ".cache").glob("*.pkl"))
+
+        with patch("biketour_planner.gpx_route_manager.read_gpx_points_fast") as mock_read:
+            manager = GPXRouteManager(simple_gpx_file.parent, output_dir)
+
+        mock_read.assert_not_called()
+        assert manager.gpx_index["test_route.gpx"]["max_elevation_m"] == 540
+
+    def test_index_cache_only_parses_new_files(self, simple_gpx_file, output_dir):
+        """Testet dass nach dem Hinzufügen einer Datei nur diese geparst wird."""
+        GPXRouteManager(simple_gpx_file.parent, output_dir)
+
+        new_file = simple_gpx_file.parent / "copy.gpx"
+        new_file.write_text(simple_gpx_file.read_text(encoding="utf-8"), encoding="utf-8")
+
+        with patch("biketour_planner.gpx_route_manager.read_gpx_points_fast", wraps=read_gpx_points_fast) as mock_read:
+            manager = GPXRouteManager(simple_gpx_file.parent, output_dir)
+
+        mock_read.assert_called_once_with(new_file)
+        assert set(manager.gpx_index) == {"test_route.gpx", "copy.gpx"}
+        assert len(list((simple_gpx_file.parent / ".cache").glob("*.pkl"))) == 1
+
+    def test_index_cache_removes_outdated_versions_only(self, simple_gpx_file, output_dir):
+        """Testet dass nur veraltete Index-Caches entfernt werden, andere Pickle-Dateien bleiben."""
+        cache_dir = simple_gpx_file.parent / ".cache"
+        cache_dir.mkdir()
+        outdated = cache_dir / "gpx_index_v0.pkl"
+        unrelated = cache_dir / "other.pkl"
+        outdated.write_bytes(b"old")
+        unrelated.write_bytes(b"keep")
+
+        GPXRouteManager(simple_gpx_file.parent, output_dir)
+
+        assert not outdated.exists()
+        assert unrelated.read_bytes() == b"keep"
+        assert (cache_dir / f"gpx_index_v{GPX_INDEX_CACHE_VERSION}.pkl").exists()
+
+    def test_index_cache_drops_removed_files(self, simple_gpx_file, output_dir):
+        """Testet dass gelöschte Dateien nicht aus dem Cache geladen werden."""
+        GPXRouteManager(simple_gpx_file.parent, output_dir)
+        simple_gpx_file.unlink()
+
+        manager = GPXRouteManager(simple_gpx_file.parent, output_dir)
+
+        assert manager.gpx_index == {}
+
+    def test_index_parallel_matches_sequential(self, simple_gpx_file, output_dir):
+        """Testet dass die parallele Indizierung dieselben Einträge liefert."""
+        gpx_files = [simple_gpx_file]
+        for i in range(GPX_INDEX_PARALLEL_MIN_FILES):
+            copy = simple_gpx_file.parent / f"copy_{i}.gpx"
+            copy.write_text(simple_gpx_file.read_text(encoding="utf-8"), encoding="utf-8")
+            gpx_files.append(copy)
+        manager = GPXRouteManager(simple_gpx_file.parent, output_dir)
+
+        parallel = manager._build_index_entries(gpx_files)
+        sequential = [manager._build_index_entry(gpx_file) for gpx_file in gpx_files]
+
+        assert len(parallel) == len(gpx_files)
+        for par, seq in zip(parallel, sequential, strict=True):
+            assert par["file"] == seq["file"]
+            assert par["total_distance_m"] == seq["total_distance_m"]
+            np.testing.assert_array_equal(par["points"], seq["points"])
+
 
 # ============================================================================
 # Test Positions-Bestimmung
@@ -382,6 +468,29 @@ class TestGetStatistics4Track:
         assert total_asc == pytest.approx(20, abs=1)
         assert total_desc == pytest.approx(0, abs=1)
 
+    def test_statistics_backward_partial_track(self, simple_gpx_file, output_dir):
+        """Testet dass rückwärts dieselbe Teilstrecke in umgekehrter Reihenfolge ausgewertet wird."""
+        manager = GPXRouteManager(simple_gpx_file.parent, output_dir)
+
+        meta = manager.gpx_index["test_route.gpx"]
+
+        # Index 1 -> 0 rückwärts: 520 -> 500
+        max_elev, total_dist, total_asc, total_desc = manager._get_statistics4track(
+            meta=meta,
+            current_index=1,
+            end_index=0,
+            max_elevation=0,
+            total_distance=0,
+            total_ascent=0,
+            total_descent=0,
+            reversed_direction=True,
+        )
+
+        assert max_elev == 520
+        assert 10000 < total_dist < 20000
+        assert total_asc == pytest.approx(0, abs=1)
+        assert total_desc == pytest.approx(20, abs=1)
+
 
 # ============================================================================
 # Test GPX-Merging
@@ -12,10 +12,12 @@ Testet die internen Hilfsmethoden des GPXRouteManager inklusive:
 # from pathlib import Path
 from unittest.mock import Mock, patch
 
+import gpxpy
 import pytest
 
-# import gpxpy
 from biketour_planner.gpx_route_manager import GPXRouteManager
+from biketour_planner.gpx_route_manager_static import read_gpx_file
+from biketour_planner.models import RouteStatistics
 
 # ============================================================================
 # Test-Fixtures
@@ -588,6 +590,46 @@ class TestProcessRouteIteration:
         assert "test_track.gpx" in used_base_files
 
 
+# ============================================================================
+# Test _add_surface_statistics
+# ============================================================================
+
+
+class TestAddSurfaceStatistics:
+    """Tests für die _add_surface_statistics Methode."""
+
+    @patch("biketour_planner.gpx_route_manager.get_route2address_with_stats")
+    def test_add_surface_statistics_sums_all_segments(self, mock_get_route, manager_with_test_track):
+        """Testet dass Oberflächen-Statistiken aller Abschnitte summiert werden."""
+        mock_get_route.return_value = ([], {"paved": 1000.0, "unpaved": 200.0, "other": 50.0})
+        stats = RouteStatistics()
+
+        segments = [(48.0, 11.0, 48.1, 11.1), (48.1, 11.1, 48.2, 11.2), (48.2, 11.2, 48.3, 11.3)]
+        manager_with_test_track._add_surface_statistics(segments, stats)
+
+        assert mock_get_route.call_count == 3
+        assert stats.paved_distance == pytest.approx(3000.0)
+        assert stats.unpaved_distance == pytest.approx(600.0)
+        assert stats.other_distance == pytest.approx(150.0)
+
+    @patch("biketour_planner.gpx_route_manager.get_route2address_with_stats")
+    def test_add_surface_statistics_skips_failed_segments(self, mock_get_route, manager_with_test_track):
+        """Testet dass fehlgeschlagene Anfragen übersprungen werden."""
+        mock_get_route.side_effect = [Exception("BRouter down"), ([], {"paved": 500.0, "unpaved": 0.0, "other": 0.0})]
+        stats = RouteStatistics()
+
+        manager_with_test_track._add_surface_statistics([(48.0, 11.0, 48.1, 11.1), (48.1, 11.1, 48.2, 11.2)], stats)
+
+        assert stats.paved_distance == pytest.approx(500.0)
+
+    @patch("biketour_planner.gpx_route_manager.get_route2address_with_stats")
+    def test_add_surface_statistics_no_segments(self, mock_get_route, manager_with_test_track):
+        """Testet dass ohne Abschnitte keine Anfrage gestellt wird."""
+        manager_with_test_track._add_surface_statistics([], RouteStatistics())
+
+        mock_get_route.assert_not_called()
+
+
 # ============================================================================
 # Test _update_gpx_index_entry
 # ============================================================================
@@ -643,6 +685,23 @@ class TestUpdateGPXIndexEntry:
         assert "test_track.gpx" not in manager.gpx_index
         assert "invalid.gpx" not in manager.gpx_index
 
+    def test_update_gpx_index_entry_refreshes_bbox_prefilter(self, manager_with_test_track, output_dir):
+        """Testet dass die Bounding-Box-Vorauswahl den neuen Eintrag findet."""
+        manager = manager_with_test_track
+        old_meta = manager.gpx_index["test_track.gpx"]
+        assert manager._files_near(old_meta["start_lat"], old_meta["start_lon"], 100) == ["test_track.gpx"]
+
+        new_gpx_file = output_dir / "moved_track.gpx"
+        new_gpx_file.write_text(
+            '<?xml version="1.0"?><gpx version="1.1"><trk><trkseg>'
+            '<trkpt lat="49.0" lon="12.0"/><trkpt lat="49.1" lon="12.1"/></trkseg></trk></gpx>',
+            encoding="utf-8",
+        )
+        manager._update_gpx_index_entry("test_track.gpx", new_gpx_file)
+
+        assert manager._files_near(49.05, 12.05, 100) == ["moved_track.gpx"]
+        assert manager._files_near(old_meta["start_lat"], old_meta["start_lon"], 100) == []
+
 
 # ============================================================================
 # Test extend_track2hotel
@@ -723,6 +782,28 @@ class TestExtendTrack2Hotel:
         assert booking["gpx_files"][-1]["is_to_hotel"] is True
         assert "to_hotel" in booking["gpx_files"][-1]["file"]
 
+    @patch("biketour_planner.gpx_route_manager.get_route2address_with_stats")
+    def test_extend_track2hotel_writes_reversed_section_and_route(self, mock_get_route, manager_with_test_track, output_dir):
+        """Testet Inhalt der geschriebenen Datei bei rückwärts befahrenem Abschnitt."""
+        manager = manager_with_test_track
+        mock_get_route.return_value = ([gpxpy.gpx.GPXTrackPoint(47.95, 10.95, elevation=490)], {"paved": 0.0, "unpaved": 0.0})
+
+        booking = {
+            "arrival_date": "2026-05-15",
+            "hotel_name": "Test Hotel",
+            "latitude": 47.95,
+            "longitude": 10.95,
+            "gpx_files": [{"file": "test_track.gpx", "start_index": 1, "end_index": 3, "reversed": True}],
+        }
+
+        result = manager.extend_track2hotel(booking, output_dir)
+
+        points = read_gpx_file(result).tracks[0].segments[0].points
+        assert [(p.latitude, p.elevation) for p in points] == [(48.3, 560), (48.2, 540), (48.1, 520), (47.95, 490)]
+        assert mock_get_route.call_args[0][:2] == (48.1, 11.1)
+        assert booking["gpx_files"][-1]["end_index"] == 3
+        assert booking["_last_gpx_file"]["end_index"] == 3
+
 
 # ============================================================================
 # Integration Tests für private Methoden
@@ -7,16 +7,42 @@ Testet die statischen Hilfsfunktionen für GPX-Verarbeitung inklusive:
 - Nächste-Punkt-Suche (find_closest_point_in_track)
 """
 
+import math
+from datetime import UTC, datetime
+
+import gpxpy
+import numpy as np
 import pytest
 
 # import math
 # from pathlib import Path
-# import gpxpy
 from biketour_planner.gpx_route_manager_static import (
+    are_near_bounding_boxes,
+    bounding_box_min_distance,
+    build_point_strip,
+    find_closest_point_in_records,
     find_closest_point_in_track,
+    find_closest_point_per_track,
     get_base_filename,
+    get_bounding_box,
+    get_statistics4file,
+    get_statistics4track,
+    get_track_points,
+    gpx_point_arrays,
     haversine,
+    haversine_rad,
+    haversine_rad_term,
+    haversine_term_to_m,
+    haversine_vec,
+    is_near_bounding_box,
+    make_point_records,
     read_gpx_file,
+    read_gpx_file_cached,
+    read_gpx_points_fast,
+    scan_gpx_files,
+    to_point_records,
+    to_radian_point,
+    write_gpx_track,
 )
 
 
@@ -125,6 +151,110 @@ class TestHaversine:
         assert distance == pytest.approx(157000, rel=0.05)
 
 
+class TestHaversineRad:
+    """Tests für haversine_rad mit vorberechneten Radiant-Punkten."""
+
+    def test_matches_haversine(self):
+        """Testet Übereinstimmung mit der Grad-Variante."""
+        for lat1, lon1, lat2, lon2 in [
+            (52.52, 13.405, 48.1351, 11.582),
+            (48.0, 11.0, 48.0001, 11.0),
+            (-33.9, 151.2, 40.7, -74.0),
+        ]:
+            distance = haversine_rad(to_radian_point(lat1, lon1), to_radian_point(lat2, lon2))
+            assert distance == pytest.approx(haversine(lat1, lon1, lat2, lon2), abs=1e-6)
+
+    def test_to_radian_point(self):
+        """Testet die Umrechnung in Radiant samt Kosinus der Breite."""
+        phi, lam, cos_phi = to_radian_point(60.0, 180.0)
+        assert phi == pytest.approx(math.pi / 3)
+        assert lam == pytest.approx(math.pi)
+        assert cos_phi == pytest.approx(0.5)
+
+    def test_term_orders_like_distance(self):
+        """Testet dass der Haversine-Term dieselbe Reihenfolge wie die Distanz liefert."""
+        origin = to_radian_point(48.0, 11.0)
+        near = to_radian_point(48.01, 11.0)
+        far = to_radian_point(48.5, 11.5)
+
+        assert haversine_rad_term(origin, near) < haversine_rad_term(origin, far)
+        assert haversine_term_to_m(haversine_rad_term(origin, far)) == haversine_rad(origin, far)
+
+
+class TestHaversineVec:
+    """Tests für die vektorisierte haversine_vec Funktion."""
+
+    def test_haversine_vec_matches_scalar(self):
+        """Testet Übereinstimmung mit der skalaren Variante."""
+        lats = np.array([48.1351, 52.5200, -33.8688])
+        lons = np.array([11.5820, 13.4050, 151.2093])
+
+        distances = haversine_vec(47.4917, 11.0953, lats, lons)
+
+        for i in range(len(lats)):
+            assert distances[i] == pytest.approx(haversine(47.4917, 11.0953, lats[i], lons[i]))
+
+    def test_haversine_vec_pairwise(self):
+        """Testet paarweise Distanzen entlang eines Tracks."""
+        lats = np.array([48.0, 48.1, 48.2])
+        lons = np.array([11.0, 11.1, 11.2])
+
+        distances = haversine_vec(lats[:-1], lons[:-1], lats[1:], lons[1:])
+
+        assert distances.shape == (2,)
+        assert distances[0] == pytest.approx(haversine(48.0, 11.0, 48.1, 11.1))
+
+    def test_haversine_vec_same_point(self):
+        """Testet Distanz 0 bei identischen Punkten."""
+        assert haversine_vec(48.0, 11.0, np.array([48.0]), np.array([11.0]))[0] == pytest.approx(0.0, abs=0.1)
+
+    def test_haversine_vec_promotes_float32(self):
+        """Testet dass float32-Eingaben in float64 gerechnet werden."""
+        lats = np.array([48.0, 48.0001], dtype=np.float32)
+        lons = np.array([11.0, 11.0], dtype=np.float32)
+
+        distances = haversine_vec(lats[:-1], lons[:-1], lats[1:], lons[1:])
+
+        assert distances.dtype == np.float64
+        assert distances[0] == pytest.approx(haversine(float(lats[0]), 11.0, float(lats[1]), 11.0))
+
+    def test_haversine_vec_series_and_exact_branch(self):
+        """Testet Genauigkeit für kurze und lange Bögen (Reihe und exakte Formel)."""
+        lats = np.array([48.00001, 48.5, 55.0, 58.0, -10.0])
+        lons = np.array([11.00001, 11.5, 15.0, 20.0, 100.0])
+
+        distances = haversine_vec(48.0, 11.0, lats, lons)
+
+        for i in range(len(lats)):
+            assert distances[i] == pytest.approx(haversine(48.0, 11.0, lats[i], lons[i]), abs=1e-3)
+
+
+class TestToPointRecords:
+    """Tests für die to_point_records Funktion."""
+
+    def test_dtypes(self):
+        """Testet float64-Koordinaten und float32-Höhen."""
+        records = to_point_records([gpxpy.gpx.GPXTrackPoint(48.123456789, 11.987654321, elevation=512.3)])
+
+        assert records["lat"].dtype == np.float64
+        assert records["elevation"].dtype == np.float32
+        assert records["lat"][0] == 48.123456789
+        assert records["elevation"][0] == pytest.approx(512.3, abs=1e-3)
+
+    def test_index_field(self):
+        """Testet dass jeder Punkt seinen Index trägt."""
+        records = to_point_records([gpxpy.gpx.GPXTrackPoint(48.0 + i * 0.1, 11.0) for i in range(3)])
+
+        assert records["index"].tolist() == [0, 1, 2]
+        assert records[2]["lat"] == pytest.approx(48.2)
+
+    def test_missing_elevation_is_nan(self):
+        """Testet dass fehlende Höhen als NaN gespeichert werden."""
+        records = to_point_records([gpxpy.gpx.GPXTrackPoint(48.0, 11.0)])
+
+        assert np.isnan(records["elevation"][0])
+
+
 class TestReadGPXFile:
     """Tests für die read_gpx_file Funktion."""
 
@@ -228,6 +358,17 @@ class TestReadGPXFile:
 
         assert gpx is None
 
+    def test_read_gpx_invalid_utf8_xml_parsed_once(self, tmp_path, monkeypatch):
+        """Testet dass ungültiges XML in gültigem UTF-8 nur einmal geparst wird."""
+        gpx_file = tmp_path / "test_invalid.gpx"
+        gpx_file.write_text('<?xml version="1.0"?>\n<gpx><name>Straße</name><unclosed_tag>', encoding="utf-8")
+        calls = []
+        original_parse = gpxpy.parse
+        monkeypatch.setattr(gpxpy, "parse", lambda text: calls.append(text) or original_parse(text))
+
+        assert read_gpx_file(gpx_file) is None
+        assert len(calls) == 1
+
     def test_read_gpx_empty_file(self, tmp_path):
         """Testet Verhalten bei leerer Datei."""
         gpx_file = tmp_path / "test_empty.gpx"
@@ -342,6 +483,197 @@ class TestReadGPXFile:
         # Sollte trotzdem erfolgreich gelesen werden
         assert gpx is not None
 
+    def test_read_gpx_missing_file(self, tmp_path):
+        """Testet dass eine fehlende Datei None liefert."""
+        assert read_gpx_file(tmp_path / "missing.gpx") is None
+
+    def test_read_gpx_bom_and_latin1(self, tmp_path):
+        """Testet BOM gefolgt von Latin-1-Inhalt (UTF-8 schlägt fehl)."""
+        gpx_content = '<?xml version="1.0"?>\n<gpx version="1.1"><trk><name>Straße</name><trkseg>'
+        gpx_content += '<trkpt lat="48.0" lon="11.0"/></trkseg></trk></gpx>'
+        gpx_file = tmp_path / "bom_latin1.gpx"
+        gpx_file.write_bytes(b"\xef\xbb\xbf" + gpx_content.encode("latin-1"))
+
+        gpx = read_gpx_file(gpx_file)
+
+        assert gpx is not None
+        assert gpx.tracks[0].name == "Straße"
+
+
+class TestReadGPXFileCached:
+    """Tests für die read_gpx_file_cached Funktion."""
+
+    GPX = '<?xml version="1.0"?><gpx version="1.1"><trk><trkseg>{}</trkseg></trk></gpx>'
+
+    def test_reuses_parsed_file(self, tmp_path):
+        """Testet dass eine unveränderte Datei nur einmal geparst wird."""
+        gpx_file = tmp_path / "cached.gpx"
+        gpx_file.write_text(self.GPX.format('<trkpt lat="48.0" lon="11.0"/>'))
+
+        assert read_gpx_file_cached(gpx_file) is read_gpx_file_cached(gpx_file)
+
+    def test_reparses_modified_file(self, tmp_path):
+        """Testet dass eine geänderte Datei neu geparst wird."""
+        gpx_file = tmp_path / "modified.gpx"
+        gpx_file.write_text(self.GPX.format('<trkpt lat="48.0" lon="11.0"/>'))
+        first = read_gpx_file_cached(gpx_file)
+
+        gpx_file.write_text(self.GPX.format('<trkpt lat="48.0" lon="11.0"/><trkpt lat="48.1" lon="11.1"/>'))
+        second = read_gpx_file_cached(gpx_file)
+
+        assert len(first.tracks[0].segments[0].points) == 1
+        assert len(second.tracks[0].segments[0].points) == 2
+
+    def test_missing_file(self, tmp_path):
+        """Testet dass eine nicht existierende Datei None liefert."""
+        assert read_gpx_file_cached(tmp_path / "missing.gpx") is None
+
+
+class TestReadGPXPointsFast:
+    """Tests für die read_gpx_points_fast Funktion."""
+
+    def test_reads_namespaced_points(self, tmp_path):
+        """Testet Lesen von Punkten mit GPX-Namespace und fehlender Höhe."""
+        gpx_content = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    <trkpt lat="48.1" lon="11.5"><ele>520.5</ele></trkpt>
+    <trkpt lat="48.2" lon="11.6"></trkpt>
+  </trkseg><trkseg>
+    <trkpt lat="48.3" lon="11.7"><ele>530</ele></trkpt>
+  </trkseg></trk>
+</gpx>"""
+        gpx_file = tmp_path / "ns.gpx"
+        gpx_file.write_text(gpx_content, encoding="utf-8")
+
+        lats, lons, elevations = read_gpx_points_fast(gpx_file)
+
+        assert lats.tolist() == [48.1, 48.2, 48.3]
+        assert lons.tolist() == [11.5, 11.6, 11.7]
+        assert elevations[0] == 520.5
+        assert np.isnan(elevations[1])
+        assert elevations[2] == 530
+
+    def test_gpx_point_arrays_matches_fast_reader(self, tmp_path):
+        """Testet dass gpx_point_arrays aus dem gpxpy-Objekt dieselben Arrays liefert."""
+        gpx_content = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    <trkpt lat="48.1" lon="11.5"><ele>520.5</ele></trkpt>
+    <trkpt lat="48.2" lon="11.6"></trkpt>
+  </trkseg></trk>
+  <trk><trkseg>
+    <trkpt lat="48.3" lon="11.7"><ele>530</ele></trkpt>
+  </trkseg></trk>
+</gpx>"""
+        gpx_file = tmp_path / "ns.gpx"
+        gpx_file.write_text(gpx_content, encoding="utf-8")
+
+        for expected, actual in zip(read_gpx_points_fast(gpx_file), gpx_point_arrays(read_gpx_file(gpx_file)), strict=True):
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_matches_gpxpy(self, tmp_path):
+        """Testet Übereinstimmung mit den von gpxpy gelesenen Punkten."""
+        points = "".join(
+            f'<trkpt lat="{48 + i * 0.0013:.7f}" lon="{11 + i * 0.0021:.7f}"><ele>{500 + i % 7 * 1.3:.1f}</ele></trkpt>'
+            for i in range(50)
+        )
+        gpx_file = tmp_path / "many.gpx"
+        gpx_file.write_text(f'<?xml version="1.0"?><gpx version="1.1"><trk><trkseg>{points}</trkseg></trk></gpx>')
+
+        lats, lons, elevations = read_gpx_points_fast(gpx_file)
+        gpx_points = read_gpx_file(gpx_file).tracks[0].segments[0].points
+
+        assert lats.tolist() == [p.latitude for p in gpx_points]
+        assert lons.tolist() == [p.longitude for p in gpx_points]
+        assert elevations.tolist() == [p.elevation for p in gpx_points]
+
+    def test_comment_and_processing_instruction_in_trkpt(self, tmp_path):
+        """Testet dass Kommentare und Processing Instructions in trkpt übersprungen werden."""
+        gpx_content = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    <trkpt lat="48.1" lon="11.5"><!-- Notiz --><?app hint?><ele>520.5</ele></trkpt>
+    <trkpt lat="48.2" lon="11.6"><!-- ohne Höhe --></trkpt>
+  </trkseg></trk>
+</gpx>"""
+        gpx_file = tmp_path / "comment.gpx"
+        gpx_file.write_text(gpx_content, encoding="utf-8")
+
+        lats, lons, elevations = read_gpx_points_fast(gpx_file)
+
+        assert lats.tolist() == [48.1, 48.2]
+        assert lons.tolist() == [11.5, 11.6]
+        assert elevations[0] == 520.5
+        assert np.isnan(elevations[1])
+
+    def test_invalid_xml_returns_none(self, tmp_path):
+        """Testet dass ungültige Dateien None liefern."""
+        gpx_file = tmp_path / "invalid.gpx"
+        gpx_file.write_text("<gpx><trk><trkseg><trkpt lat=")
+
+        assert read_gpx_points_fast(gpx_file) is None
+
+
+class TestScanGPXFiles:
+    """Tests für scan_gpx_files."""
+
+    def test_lists_gpx_files_like_glob(self, tmp_path):
+        """Testet dass nur reguläre .gpx-Dateien in Glob-Reihenfolge mit Größe und mtime geliefert werden."""
+        for name in ["b.gpx", "a.gpx", "notes.txt"]:
+            (tmp_path / name).write_text("<gpx/>", encoding="utf-8")
+        (tmp_path / "folder.gpx").mkdir()
+
+        files = scan_gpx_files(tmp_path)
+
+        assert [path for path, _, _ in files] == [p for p in tmp_path.glob("*.gpx") if p.is_file()]
+        for path, size, mtime_ns in files:
+            assert (size, mtime_ns) == (path.stat().st_size, path.stat().st_mtime_ns)
+
+    def test_extension_is_case_insensitive(self, tmp_path):
+        """Testet dass auch Dateien mit Endung .GPX gefunden werden."""
+        for name in ["upper.GPX", "mixed.Gpx", "lower.gpx", "other.GPS"]:
+            (tmp_path / name).write_text("<gpx/>", encoding="utf-8")
+
+        files = scan_gpx_files(tmp_path)
+
+        assert sorted(path.name for path, _, _ in files) == ["lower.gpx", "mixed.Gpx", "upper.GPX"]
+
+    def test_missing_directory(self, tmp_path):
+        """Testet leere Liste für nicht existierende Verzeichnisse."""
+        assert scan_gpx_files(tmp_path / "missing") == []
+
+
+class TestWriteGPXTrack:
+    """Tests für die write_gpx_track Funktion."""
+
+    def test_roundtrip_with_gpxpy(self, tmp_path):
+        """Testet, dass gpxpy die geschriebenen Punkte unverändert einliest."""
+        time = datetime(2024, 5, 1, 8, 30, tzinfo=UTC)
+        points = [
+            gpxpy.gpx.GPXTrackPoint(48.1234567, 11.7654321, elevation=520.5, time=time),
+            gpxpy.gpx.GPXTrackPoint(48.2, 11.6),
+        ]
+        gpx_file = tmp_path / "out.gpx"
+
+        count = write_gpx_track(gpx_file, iter(points))
+
+        assert count == 2
+        read_points = read_gpx_file(gpx_file).tracks[0].segments[0].points
+        assert [(p.latitude, p.longitude, p.elevation) for p in read_points] == [
+            (48.1234567, 11.7654321, 520.5),
+            (48.2, 11.6, None),
+        ]
+        assert read_points[0].time == time
+        assert read_points[1].time is None
+
+    def test_empty_track(self, tmp_path):
+        """Testet das Schreiben eines Tracks ohne Punkte."""
+        gpx_file = tmp_path / "empty.gpx"
+
+        assert write_gpx_track(gpx_file, []) == 0
+        assert read_gpx_points_fast(gpx_file)[0].size == 0
+
 
 class TestGetBaseFilename:
     """Tests für die get_base_filename Funktion."""
@@ -419,6 +751,11 @@ class TestGetBaseFilename:
         result = get_base_filename("route_inverted_reversed.gpx")
         assert result == "route_inverted.gpx"
 
+    def test_get_base_filename_uppercase_extension(self):
+        """Testet, dass die Extension nur bei entferntem Suffix normalisiert wird."""
+        assert get_base_filename("route_rev.GPX") == "route.gpx"
+        assert get_base_filename("route.GPX") == "route.GPX"
+
 
 class TestFindClosestPointInTrack:
     """Tests für die find_closest_point_in_track Funktion."""
@@ -568,6 +905,293 @@ class TestFindClosestPointInTrack:
         assert dist == float("inf")
 
 
+class TestFindClosestPointInTrackArray:
+    """Tests für find_closest_point_in_track mit Punkt-Arrays."""
+
+    def test_matches_list_input(self):
+        """Testet Übereinstimmung zwischen Array- und Listen-Eingabe."""
+        coords = [(47.5 + 0.013 * i, 10.8 + 0.021 * (i % 11)) for i in range(80)]
+        records = to_point_records([gpxpy.gpx.GPXTrackPoint(lat, lon) for lat, lon in coords])
+        dict_points = [{"lat": lat, "lon": lon, "index": i} for i, (lat, lon) in enumerate(coords)]
+
+        idx, dist = find_closest_point_in_track(records, 48.0, 11.0)
+        expected_idx, expected_dist = find_closest_point_in_track(dict_points, 48.0, 11.0)
+
+        assert idx == expected_idx
+        assert isinstance(idx, int)
+        assert dist == pytest.approx(expected_dist)
+
+    def test_uses_index_field(self):
+        """Testet dass bei Teil-Arrays der gespeicherte Index zurückgegeben wird."""
+        records = to_point_records([gpxpy.gpx.GPXTrackPoint(48.0 + i * 0.01, 11.0) for i in range(10)])
+
+        idx, _ = find_closest_point_in_track(records[5:], 48.0, 11.0)
+
+        assert idx == 5
+
+
+class TestFindClosestPointInRecords:
+    """Tests für die find_closest_point_in_records Funktion."""
+
+    @staticmethod
+    def _records(coords):
+        return to_point_records([gpxpy.gpx.GPXTrackPoint(lat, lon) for lat, lon in coords])
+
+    def test_matches_haversine_search(self):
+        """Testet, dass derselbe Punkt wie bei der exakten Suche gefunden wird."""
+        coords = [(48.0 + 0.01 * i, 11.0 + 0.015 * (i % 7)) for i in range(50)]
+        dict_points = [{"lat": lat, "lon": lon, "index": i} for i, (lat, lon) in enumerate(coords)]
+
+        idx, dist = find_closest_point_in_records(self._records(coords), 48.233, 11.05)
+        expected_idx, expected_dist = find_closest_point_in_track(dict_points, 48.233, 11.05)
+
+        assert idx == expected_idx
+        assert dist == pytest.approx(expected_dist)
+
+    def test_returns_exact_distance(self):
+        """Testet, dass die zurückgegebene Distanz die Haversine-Distanz ist."""
+        idx, dist = find_closest_point_in_records(self._records([(48.0, 11.0), (49.0, 12.0)]), 48.1, 11.1)
+
+        assert idx == 0
+        assert dist == pytest.approx(haversine(48.1, 11.1, 48.0, 11.0))
+
+    def test_max_distance_skips_exact_distance(self):
+        """Testet dass weit entfernte Punkte nur näherungsweise vermessen werden."""
+        records = self._records([(48.0, 11.0), (48.5, 11.0)])
+
+        idx, dist = find_closest_point_in_records(records, 49.0, 11.0, max_distance_m=1000)
+
+        assert idx == 1
+        assert dist > 1000
+        assert dist == pytest.approx(haversine(49.0, 11.0, 48.5, 11.0), rel=1e-3)
+
+    def test_max_distance_keeps_exact_distance_within_limit(self):
+        """Testet dass nahe Punkte exakt vermessen werden."""
+        records = self._records([(48.0, 11.0), (48.005, 11.0)])
+
+        idx, dist = find_closest_point_in_records(records, 48.0051, 11.0, max_distance_m=1000)
+
+        assert idx == 1
+        assert dist == haversine(48.0051, 11.0, 48.005, 11.0)
+
+    def test_empty_records(self):
+        """Testet Verhalten bei leerem Array."""
+        idx, dist = find_closest_point_in_records(self._records([]), 48.0, 11.0)
+
+        assert idx is None
+        assert dist == float("inf")
+
+
+class TestFindClosestPointPerTrack:
+    """Tests für build_point_strip und find_closest_point_per_track."""
+
+    def test_matches_per_track_search(self):
+        """Testet Übereinstimmung mit find_closest_point_in_records je Track."""
+        rng = np.random.default_rng(0)
+        tracks = []
+        for _ in range(20):
+            n = int(rng.integers(1, 100))
+            lats = 48.0 + rng.random() * 0.1 + np.cumsum(rng.normal(0, 0.0005, n))
+            lons = 11.0 + rng.random() * 0.1 + np.cumsum(rng.normal(0, 0.0005, n))
+            tracks.append(make_point_records(lats, lons, np.zeros(n)))
+        strip = build_point_strip(tracks)
+
+        for lat, lon in rng.random((50, 2)) * 0.12 + (48.0, 11.0):
+            expected = []
+            for owner, points in enumerate(tracks):
+                idx, dist = find_closest_point_in_records(points, lat, lon, max_distance_m=1000)
+                if dist <= 1000:
+                    expected.append((owner, idx, dist))
+
+            result = [entry for entry in find_closest_point_per_track(strip, lat, lon, 1000) if entry[2] <= 1000]
+            assert result == expected
+
+    def test_duplicate_points_return_first_index(self):
+        """Testet dass bei gleichen Punkten (Hin- und Rückweg) der erste Index gewinnt."""
+        points = make_point_records([48.0, 48.001, 48.0], [11.0, 11.0, 11.0], [0.0, 0.0, 0.0])
+
+        assert find_closest_point_per_track(build_point_strip([points]), 48.0, 11.0, 100) == [(0, 0, 0.0)]
+
+    def test_no_points_in_band(self):
+        """Testet leeres Ergebnis ohne Punkte in der Nähe bzw. ohne Tracks."""
+        points = make_point_records([48.0], [11.0], [0.0])
+
+        assert find_closest_point_per_track(build_point_strip([points]), 49.0, 11.0, 1000) == []
+        assert find_closest_point_per_track(build_point_strip([]), 48.0, 11.0, 1000) == []
+
+    def test_neighbouring_rows_and_same_latitude(self):
+        """Testet Treffer in benachbarten Gitterzeilen und Ausschluss weit entfernter Längen."""
+        # 48.0 und 47.999 liegen in verschiedenen Breitenzeilen, 12.0 auf gleicher Breite ist weit weg
+        near_row_below = make_point_records([47.999], [11.0], [0.0])
+        same_latitude_far = make_point_records([48.0], [12.0], [0.0])
+        strip = build_point_strip([near_row_below, same_latitude_far])
+
+        result = find_closest_point_per_track(strip, 48.0, 11.0, 500)
+
+        assert [(owner, idx) for owner, idx, _ in result] == [(0, 0)]
+        assert result[0][2] == pytest.approx(haversine(48.0, 11.0, 47.999, 11.0))
+
+
+class TestBoundingBox:
+    """Tests für get_bounding_box, is_near_bounding_box und bounding_box_min_distance."""
+
+    def test_get_bounding_box(self):
+        """Testet die Berechnung der Bounding Box."""
+        points = to_point_records(
+            [gpxpy.gpx.GPXTrackPoint(lat, lon) for lat, lon in [(48.2, 11.0), (48.0, 11.3), (48.1, 11.1)]]
+        )
+
+        assert get_bounding_box(points) == (48.0, 11.0, 48.2, 11.3)
+
+    def test_point_inside_box(self):
+        """Testet einen Punkt innerhalb der Box."""
+        assert is_near_bounding_box((48.0, 11.0, 48.2, 11.3), 48.1, 11.1, 0)
+
+    def test_point_within_radius(self):
+        """Testet einen Punkt knapp außerhalb der Box, aber innerhalb des Radius."""
+        bbox = (48.0, 11.0, 48.2, 11.3)
+        # ca. 750 m nördlich bzw. östlich der Box
+        assert is_near_bounding_box(bbox, 48.2 + 0.00675, 11.1, 1000)
+        assert is_near_bounding_box(bbox, 48.1, 11.31, 1000)
+
+    def test_point_far_away(self):
+        """Testet einen weit entfernten Punkt."""
+        bbox = (48.0, 11.0, 48.2, 11.3)
+        assert not is_near_bounding_box(bbox, 48.3, 11.1, 1000)
+        assert not is_near_bounding_box(bbox, 48.1, 11.5, 1000)
+
+    def test_never_rejects_point_within_radius(self):
+        """Testet dass die Prüfung konservativ ist."""
+        bbox = (60.0, 10.0, 60.0, 10.0)
+        # Punkte knapp innerhalb von 1000 m in verschiedenen Richtungen
+        for lat, lon in [(60.0089, 10.0), (60.0, 10.0179), (59.9937, 9.9874)]:
+            assert haversine(60.0, 10.0, lat, lon) <= 1000
+            assert is_near_bounding_box(bbox, lat, lon, 1000)
+
+    def test_are_near_bounding_boxes_matches_scalar(self):
+        """Testet Übereinstimmung der vektorisierten Prüfung mit is_near_bounding_box."""
+        bboxes = np.array([(48.0, 11.0, 48.2, 11.3), (60.0, 10.0, 60.0, 10.0), (-10.0, -5.0, -9.0, -4.0)])
+
+        for lat, lon in [(48.1, 11.1), (48.2 + 0.00675, 11.1), (48.3, 11.1), (60.0089, 10.0), (-9.5, -4.5), (0.0, 0.0)]:
+            mask = are_near_bounding_boxes(bboxes, lat, lon, 1000)
+            assert mask.tolist() == [is_near_bounding_box(tuple(bbox), lat, lon, 1000) for bbox in bboxes]
+
+    def test_min_distance_inside_box(self):
+        """Testet Distanz 0 für einen Punkt innerhalb der Box."""
+        assert bounding_box_min_distance((48.0, 11.0, 48.2, 11.3), 48.1, 11.1) == 0.0
+
+    def test_min_distance_is_lower_bound(self):
+        """Testet dass kein Punkt der Box näher liegt als die untere Schranke."""
+        bbox = (48.0, 11.0, 48.2, 11.3)
+        box_lats = np.linspace(48.0, 48.2, 21)
+        box_lons = np.linspace(11.0, 11.3, 31)
+        grid_lats, grid_lons = (a.ravel() for a in np.meshgrid(box_lats, box_lons))
+
+        for lat, lon in [(48.5, 11.1), (47.9, 10.8), (48.1, 11.6), (48.3, 11.4), (-48.0, 11.1)]:
+            bound = bounding_box_min_distance(bbox, lat, lon)
+            closest = haversine_vec(lat, lon, grid_lats, grid_lons).min()
+            assert 0 < bound <= closest + 1e-6
+            assert bound > 0.9 * closest
+
+
+class TestGetTrackPoints:
+    """Tests für die get_track_points Funktion."""
+
+    @pytest.fixture
+    def multi_segment_gpx(self, tmp_path):
+        """Erstellt GPX mit zwei Tracks und drei Segmenten (7 Punkte)."""
+        gpx_content = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1">
+  <trk>
+    <trkseg>
+      <trkpt lat="48.0" lon="11.0"/>
+      <trkpt lat="48.1" lon="11.1"/>
+    </trkseg>
+    <trkseg>
+      <trkpt lat="48.2" lon="11.2"/>
+      <trkpt lat="48.3" lon="11.3"/>
+      <trkpt lat="48.4" lon="11.4"/>
+    </trkseg>
+  </trk>
+  <trk>
+    <trkseg>
+      <trkpt lat="48.5" lon="11.5"/>
+      <trkpt lat="48.6" lon="11.6"/>
+    </trkseg>
+  </trk>
+</gpx>"""
+        gpx_file = tmp_path / "multi.gpx"
+        gpx_file.write_text(gpx_content, encoding="utf-8")
+        return read_gpx_file(gpx_file)
+
+    def test_get_track_points_all(self, multi_segment_gpx):
+        """Testet dass ohne Indizes alle Punkte zurückgegeben werden."""
+        points = get_track_points(multi_segment_gpx)
+
+        assert [p.latitude for p in points] == [48.0, 48.1, 48.2, 48.3, 48.4, 48.5, 48.6]
+
+    def test_get_track_points_across_segments(self, multi_segment_gpx):
+        """Testet Fenster über Segment- und Track-Grenzen hinweg."""
+        points = get_track_points(multi_segment_gpx, 1, 5)
+
+        assert [p.latitude for p in points] == [48.1, 48.2, 48.3, 48.4, 48.5]
+
+    def test_get_track_points_within_segment(self, multi_segment_gpx):
+        """Testet Fenster innerhalb eines Segments."""
+        points = get_track_points(multi_segment_gpx, 3, 3)
+
+        assert [p.latitude for p in points] == [48.3]
+
+    def test_get_track_points_end_clamped(self, multi_segment_gpx):
+        """Testet dass zu große Endindizes begrenzt werden."""
+        points = get_track_points(multi_segment_gpx, 5, 100)
+
+        assert [p.latitude for p in points] == [48.5, 48.6]
+
+    def test_get_track_points_empty_window(self, multi_segment_gpx):
+        """Testet leeres Ergebnis bei Start > Ende."""
+        assert get_track_points(multi_segment_gpx, 4, 2) == []
+
+    def test_statistics4track_uses_same_window(self, multi_segment_gpx):
+        """Testet dass get_statistics4track dasselbe Fenster auswertet."""
+        _, distance, _, _ = get_statistics4track(multi_segment_gpx, 1, 5)
+
+        assert distance == pytest.approx(
+            sum(haversine(48.0 + i / 10, 11.0 + i / 10, 48.1 + i / 10, 11.1 + i / 10) for i in range(1, 5))
+        )
+
+    def test_statistics4track_reversed_segments(self, multi_segment_gpx):
+        """Testet rückwärts durchlaufene Segmente über Segmentgrenzen hinweg."""
+        # Rückwärts: 48.1, 48.0 | 48.4, 48.3, 48.2 | 48.6, 48.5 -> Fenster 1..3 = 48.0, 48.4, 48.3
+        _, distance, _, _ = get_statistics4track(multi_segment_gpx, 1, 3, reversed_direction=True)
+
+        assert distance == pytest.approx(haversine(48.0, 11.0, 48.4, 11.4) + haversine(48.4, 11.4, 48.3, 11.3))
+
+    def test_statistics4file_matches_statistics4track(self, tmp_path):
+        """Testet dass get_statistics4file dieselben Werte wie get_statistics4track liefert."""
+        gpx_content = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk>
+    <trkseg>
+      <trkpt lat="48.0" lon="11.0"><ele>500</ele></trkpt>
+      <trkpt lat="48.1" lon="11.1"/>
+    </trkseg>
+    <trkseg>
+      <trkpt lat="48.2" lon="11.2"><ele>650.5</ele></trkpt>
+      <trkpt lat="48.3" lon="11.3"><ele>580</ele></trkpt>
+    </trkseg>
+  </trk>
+</gpx>"""
+        gpx_file = tmp_path / "stats.gpx"
+        gpx_file.write_text(gpx_content, encoding="utf-8")
+
+        assert get_statistics4file(gpx_file) == get_statistics4track(read_gpx_file(gpx_file))
+
+    def test_statistics4file_missing_file(self, tmp_path):
+        """Testet None für nicht existierende Dateien."""
+        assert get_statistics4file(tmp_path / "missing.gpx") is None
+
+
 class TestIntegration:
     """Integrationstests für Zusammenspiel der Funktionen."""
 
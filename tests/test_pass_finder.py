@@ -97,12 +97,9 @@ def test_find_pass_track_reversed(mock_get_config, mock_get_endpoints, tmp_path)
 @patch("biketour_planner.pass_finder.load_json")
 @patch("biketour_planner.pass_finder.geocode_address")
 @patch("biketour_planner.pass_finder.find_pass_track")
-@patch("biketour_planner.pass_finder.read_gpx_file")
-@patch("biketour_planner.pass_finder.get_statistics4track")
+@patch("biketour_planner.pass_finder.get_statistics4file")
 @patch("biketour_planner.pass_finder.get_config")
-def test_process_passes(
-    mock_get_config, mock_get_stats, mock_read_gpx, mock_find_track, mock_geocode, mock_load_json, tmp_path
-):
+def test_process_passes(mock_get_config, mock_get_stats, mock_find_track, mock_geocode, mock_load_json, tmp_path):
     # Setup config
     mock_config = MagicMock()
     mock_config.passes.hotel_radius_km = 1.0
@@ -118,7 +115,6 @@ def test_process_passes(
     gpx_file = tmp_path / "alpe.gpx"
     mock_find_track.return_value = gpx_file
 
-    mock_read_gpx.return_value = MagicMock(tracks=[True])
     mock_get_stats.return_value = (1800.0, 14000.0, 1100.0, 0.0)
 
     bookings = [{"hotel_name": "Hotel Huez", "latitude": 45.01, "longitude": 6.01}]
@@ -207,3 +203,27 @@ def mock_get_config():
         mock_config.passes.pass_radius_km = 1.0
         m.return_value = mock_config
         yield m
+
+
+def test_get_gpx_endpoints_from_file(tmp_path):
+    gpx_file = tmp_path / "pass.gpx"
+    gpx_file.write_text(
+        '<?xml version="1.0"?><gpx version="1.1"><trk><trkseg>'
+        '<trkpt lat="46.1" lon="10.1"></trkpt><trkpt lat="46.2" lon="10.2"></trkpt><trkpt lat="46.3" lon="10.3"></trkpt>'
+        "</trkseg></trk></gpx>"
+    )
+
+    assert get_gpx_endpoints(gpx_file) == (46.1, 10.1, 46.3, 10.3)
+
+
+def test_find_pass_track_reads_each_file_once(tmp_path, mock_get_config):
+    gpx_dir = tmp_path / "gpx"
+    gpx_dir.mkdir()
+    (gpx_dir / "pass.gpx").write_text("dummy")
+
+    with patch("biketour_planner.pass_finder.get_gpx_endpoints", return_value=(0.0, 0.0, 0.001, 0.001)) as mock_endpoints:
+        find_pass_track(0.0, 0.0, 0.001, 0.001, gpx_dir)
+        track = find_pass_track(0.0, 0.0, 0.001, 0.001, gpx_dir)
+
+    assert track == gpx_dir / "pass.gpx"
+    mock_endpoints.assert_called_once()
@@ -8,7 +8,7 @@ Testet den PDF-Export inklusive:
 - Excel-Info-Integration
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 from reportlab.lib import colors
@@ -528,9 +528,8 @@ class TestExportBookingsToPDF:
 
     @patch("biketour_planner.pdf_export.SimpleDocTemplate")
     @patch("biketour_planner.pdf_export.get_merged_gpx_files_from_bookings")
-    @patch("biketour_planner.pdf_export.read_gpx_file")
-    @patch("biketour_planner.pdf_export.get_statistics4track")
-    def test_export_with_pass_tracks(self, mock_stats, mock_read_gpx, mock_get_gpx, mock_doc, tmp_path):
+    @patch("biketour_planner.pdf_export.get_statistics4file")
+    def test_export_with_pass_tracks(self, mock_stats, mock_get_gpx, mock_doc, tmp_path):
         """Testet PDF-Export mit Pass-Tracks."""
         bookings = [
             {
@@ -558,7 +557,6 @@ class TestExportBookingsToPDF:
         json_path.write_text(json.dumps(bookings), encoding="utf-8")
 
         mock_get_gpx.return_value = []
-        mock_read_gpx.return_value = MagicMock(tracks=[True])
         mock_stats.return_value = (2000.0, 10000.0, 1000.0, 0.0)
 
         export_bookings_to_pdf(json_path, output_path, gpx_dir=gpx_dir)
@@ -1,6 +1,13 @@
 import json
 
-from biketour_planner.utils.cache import json_cache, load_json_cache
+import pytest
+
+from biketour_planner.utils.cache import (
+    json_cache,
+    load_json_cache,
+    load_pickle_cache,
+    save_pickle_cache,
+)
 
 
 def test_load_json_cache(tmp_path):
@@ -63,3 +70,54 @@ def test_json_cache_exception_handling(tmp_path):
 
     # Should not raise exception
     assert my_func(1) == 1
+
+
+def test_pickle_cache_roundtrip(tmp_path):
+    cache_file = tmp_path / ".cache" / "new.pkl"
+
+    assert save_pickle_cache(cache_file, {"key": [1, 2, 3]})
+    assert load_pickle_cache(cache_file) == {"key": [1, 2, 3]}
+
+
+def test_save_pickle_cache_keeps_other_files(tmp_path):
+    cache_file = tmp_path / ".cache" / "new.pkl"
+    other_file = tmp_path / ".cache" / "old.pkl"
+    other_file.parent.mkdir()
+    other_file.write_bytes(b"old")
+
+    assert save_pickle_cache(cache_file, {"key": 1})
+    assert other_file.read_bytes() == b"old"
+
+
+def test_save_pickle_cache_leaves_no_temp_files(tmp_path):
+    cache_file = tmp_path / ".cache" / "new.pkl"
+
+    assert save_pickle_cache(cache_file, {"key": 1})
+    with pytest.raises(AttributeError):
+        save_pickle_cache(cache_file, lambda: None)
+
+    assert [p.name for p in cache_file.parent.iterdir()] == ["new.pkl"]
+    assert load_pickle_cache(cache_file) == {"key": 1}
+
+
+def test_load_pickle_cache_invalid(tmp_path):
+    cache_file = tmp_path / "invalid.pkl"
+    cache_file.write_bytes(b"not a pickle")
+
+    assert load_pickle_cache(cache_file) is None
+    assert load_pickle_cache(tmp_path / "missing.pkl") is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"\x80\x05\x95",  # abgeschnittener Header
+        b"I12a\n.",  # ValueError beim Parsen
+        b"\x80\x02cbuiltins\nint\nU\x01x\x85R.",  # ValueError im Konstruktor
+    ],
+)
+def test_load_pickle_cache_corrupt(tmp_path, content):
+    cache_file = tmp_path / "corrupt.pkl"
+    cache_file.write_bytes(content)
+
+    assert load_pickle_cache(cache_file) is None